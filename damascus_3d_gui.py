@@ -61,26 +61,88 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolb
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import logging
+import re
+import threading
+from collections import deque
 from datetime import datetime
 import json
 from pathlib import Path
 
+# Optional: OpenCV shrinks the cross-section preview (PIL otherwise)
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    cv2 = None
+    CV2_AVAILABLE = False
+
 # Import our 3D Damascus engine
-from damascus_3d_simulator import Damascus3DBillet, DamascusLayer, logger, LOGS_DIR as SIM_LOGS_DIR
-import open3d as o3d
+from damascus_3d_simulator import (Damascus3DBillet, DamascusLayer, logger, warm_up_kernels,
+                                   LOGS_DIR as SIM_LOGS_DIR)
 
 # Import steel database
-from data.steel_database import get_database
+from data.steel_database import Steel, get_database
 
 PROJECT_ROOT = Path(__file__).resolve().parent
 DATA_DIR = PROJECT_ROOT / "data"
 FORGING_LOSSES_PATH = DATA_DIR / "steel-losses-during-forging.txt"
 PLASTICITY_GUIDE_PATH = DATA_DIR / "steel-plasticity.txt"
 
+# Heat-treatment guide parsing: section headers are either numbered
+# ("1. O1 OIL-HARDENING TOOL STEEL") or bare steel names ("15N20 High Nickel...")
+_STEEL_SECTION_SPLIT_RE = re.compile(r'((?:\d+\.\s+)?[A-Z0-9]+\s+[A-Z][A-Za-z\s\-/()]+(?:Steel|STEEL)?)')
+_STEEL_HEADER_RE = re.compile(r'^(?:\d+\.\s+)?[A-Z0-9]+\s+[A-Z]')
+_SECTION_NUMBER_RE = re.compile(r'^\d+\.\s+')
+
+# Mouse wheel sequences: <MouseWheel> on Windows/macOS, buttons 4/5 on X11
+_WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+def _wheel_scroll_units(event) -> int:
+    """Number of units to scroll for a mouse wheel event (negative = up)."""
+    if event.num == 4:
+        return -1
+    if event.num == 5:
+        return 1
+    return int(-1*(event.delta/120))
+
+
+def _is_inside(widget, container) -> bool:
+    """True if `widget` is `container` or one of its descendants."""
+    path, container_path = str(widget), str(container)
+    return path == container_path or path.startswith(container_path + '.')
+
+
+def _resize_grayscale_image(img: np.ndarray, size: tuple) -> Image.Image:
+    """
+    Resize a uint8 grayscale image to (width, height) for display.
+    
+    Shrinking goes through OpenCV's area filter when it is installed,
+    straight from the array with no PIL round trip. Otherwise PIL is used:
+    Lanczos, or bilinear for a heavy shrink (under a quarter of the source
+    in either direction), where Lanczos costs far more for no visible gain
+    on a two-tone slice.
+    """
+    width, height = size
+    src_height, src_width = img.shape[:2]
+    if CV2_AVAILABLE and width <= src_width and height <= src_height:
+        return Image.fromarray(cv2.resize(img, (width, height), interpolation=cv2.INTER_AREA))
+    
+    if width * 4 < src_width or height * 4 < src_height:
+        resample = Image.Resampling.BILINEAR
+    else:
+        resample = Image.Resampling.LANCZOS
+    return Image.fromarray(img).resize((width, height), resample)
+
 
 class TkTextLogHandler(logging.Handler):
     """Logging handler that streams log messages into a Tkinter text widget."""
 
+    # Lines kept in the widget; older output is dropped from the top
+    MAX_LINES = 3000
+    # Interval (ms) at which records queued from worker threads are shown
+    POLL_MS = 200
+
     def __init__(self, root, text_widget):
         super().__init__()
         self.root = root
@@ -89,20 +151,55 @@ class TkTextLogHandler(logging.Handler):
             '%(asctime)s | %(levelname)-8s | %(message)s',
             datefmt='%H:%M:%S'
         ))
+        # Messages waiting for the next widget update; bursts of records are
+        # written in one insert instead of one Tk callback each
+        self._pending = deque(maxlen=self.MAX_LINES)
+        self._append_scheduled = False
+        # Tk may only be called from the main thread; records from worker
+        # threads just queue up and are drained by this periodic poll
+        self._poll_id = self.root.after(self.POLL_MS, self._poll)
 
     def emit(self, record):
         try:
-            message = self.format(record)
-            self.root.after(0, self._append, message)
+            self._pending.append(self.format(record))
+            if threading.current_thread() is not threading.main_thread():
+                return
+            if not self._append_scheduled:
+                self._append_scheduled = True
+                self.root.after(0, self._append)
         except Exception:
             self.handleError(record)
 
-    def _append(self, message):
-        if not self.text_widget or not self.text_widget.winfo_exists():
+    def _poll(self):
+        self._append()
+        self._poll_id = self.root.after(self.POLL_MS, self._poll)
+
+    def close(self):
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except tk.TclError:
+                pass  # root already destroyed
+            self._poll_id = None
+        super().close()
+
+    def _append(self):
+        self.acquire()
+        try:
+            messages = list(self._pending)
+            self._pending.clear()
+            self._append_scheduled = False
+        finally:
+            self.release()
+
+        if not messages or not self.text_widget or not self.text_widget.winfo_exists():
             return
 
         self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.insert(tk.END, message + "\n")
+        self.text_widget.insert(tk.END, "\n".join(messages) + "\n")
+        line_count = int(self.text_widget.index('end-1c').split('.')[0])
+        if line_count > self.MAX_LINES:
+            self.text_widget.delete('1.0', f'{line_count - self.MAX_LINES}.0')
         self.text_widget.see(tk.END)
         self.text_widget.config(state=tk.DISABLED)
 
@@ -154,8 +251,10 @@ class Damascus3DGUI:
         self.fig_3d = None
         self.ax_3d = None
         self.canvas_3d = None
-        self.cross_section_image = None
         self.cross_section_display = None
+        self.cross_section_item = None  # Canvas image item, reused across updates
+        self._pending_3d_view_update = None  # Tk after() id of a queued redraw
+        self._3d_geometry_cache = None  # (geometry stamps, faces, facecolors) last drawn
         
         # View orientation controls
         self.view_elevation = tk.DoubleVar(value=30.0)
@@ -188,6 +287,10 @@ class Damascus3DGUI:
         # Create initial billet
         self.create_new_billet()
         
+        # Compile the JIT kernels in the background while the user sets up
+        # the first operation, so it doesn't stall on compilation
+        threading.Thread(target=warm_up_kernels, name="kernel-warmup", daemon=True).start()
+        
         logger.info("GUI initialization complete")
     
     def setup_style(self):
@@ -283,10 +386,14 @@ class Damascus3DGUI:
         left_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Enable mouse wheel scrolling
+        # Enable mouse wheel scrolling over the panel. Bound on the main
+        # window instead of bind_all, so wheel events in dialogs and over the
+        # viewports (the 3D view zooms on the wheel) don't reach it
         def _on_mousewheel(event):
-            left_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        left_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            if _is_inside(event.widget, left_canvas):
+                left_canvas.yview_scroll(_wheel_scroll_units(event), "units")
+        for sequence in _WHEEL_EVENTS:
+            self.root.bind(sequence, _on_mousewheel, add='+')
         
         # Right panel (viewports) - 75% width
         right_panel = ttk.Frame(main_container)
@@ -407,12 +514,12 @@ class Damascus3DGUI:
         
         ttk.Label(view_frame, text="Elevation (°):").grid(row=0, column=0, sticky=tk.W, pady=2)
         ttk.Scale(view_frame, from_=-90, to=90, variable=self.view_elevation,
-                 orient=tk.HORIZONTAL, command=lambda v: self.update_3d_view()).grid(row=0, column=1, sticky=tk.EW, pady=2)
+                 orient=tk.HORIZONTAL, command=lambda v: self._schedule_3d_view_update()).grid(row=0, column=1, sticky=tk.EW, pady=2)
         ttk.Label(view_frame, textvariable=self.view_elevation).grid(row=0, column=2, pady=2)
         
         ttk.Label(view_frame, text="Azimuth (°):").grid(row=1, column=0, sticky=tk.W, pady=2)
         ttk.Scale(view_frame, from_=0, to=360, variable=self.view_azimuth,
-                 orient=tk.HORIZONTAL, command=lambda v: self.update_3d_view()).grid(row=1, column=1, sticky=tk.EW, pady=2)
+                 orient=tk.HORIZONTAL, command=lambda v: self._schedule_3d_view_update()).grid(row=1, column=1, sticky=tk.EW, pady=2)
         ttk.Label(view_frame, textvariable=self.view_azimuth).grid(row=1, column=2, pady=2)
         
         ttk.Button(view_frame, text="Top View (Build Plate)", 
@@ -810,13 +917,11 @@ class Damascus3DGUI:
                 spacing = self.hole_spacing.get()
                 radius = self.hole_radius.get()
                 
-                # Create grid
+                # Create grid and drill it in a single pass
                 start = -(grid_size - 1) * spacing / 2
-                for i in range(grid_size):
-                    for j in range(grid_size):
-                        x_pos = start + i * spacing
-                        z_pos = start + j * spacing
-                        self.billet.drill_hole(x_pos, z_pos, radius, debug=(i==0 and j==0))
+                positions = [(start + i * spacing, start + j * spacing)
+                             for i in range(grid_size) for j in range(grid_size)]
+                self.billet.drill_holes(positions, radius, debug=True)
                 
                 op_desc = f"Drilled {grid_size}×{grid_size} holes, radius={radius:.1f}mm"
             
@@ -876,7 +981,7 @@ class Damascus3DGUI:
         dialog.grab_set()
         
         # Current dimensions info
-        current_height = sum(l.thickness for l in self.billet.layers)
+        current_height = self.billet.total_height
         current_volume = self.billet.width * self.billet.length * current_height
         
         info_frame = ttk.LabelFrame(dialog, text="Current Billet", padding=10)
@@ -1051,9 +1156,7 @@ class Damascus3DGUI:
         
         # Store original vertex positions BEFORE any transformation
         logger.debug(f"Storing original vertex positions for {len(self.billet.layers)} layers...")
-        original_vertices = []
-        for layer in self.billet.layers:
-            original_vertices.append(np.asarray(layer.mesh.vertices).copy())
+        original_vertices = self.billet.vertices.copy()  # (N_layers, 8, 3) snapshot
         
         # Store original layer properties
         original_layer_thickness = [layer.thickness for layer in self.billet.layers]
@@ -1077,29 +1180,21 @@ class Damascus3DGUI:
             scale_y = target_length / original_length
             scale_z = target_height / original_height
             
-            logger.debug(f"  Cumulative scale from original: X={scale_x:.3f}, Y={scale_y:.3f}, Z={scale_z:.3f}")
+            logger.debug("  Cumulative scale from original: X=%.3f, Y=%.3f, Z=%.3f", scale_x, scale_y, scale_z)
             
-            # Apply to each layer (transform from ORIGINAL vertices)
-            for layer_idx, layer in enumerate(self.billet.layers):
-                # Get ORIGINAL vertices for this layer
-                vertices = original_vertices[layer_idx].copy()
-                
-                if layer_idx == 0 and heat_num == 0:
-                    logger.debug(f"  Layer 0 original vertex[0]: {vertices[0]}")
-                
-                # Apply transformation from original positions
-                for i in range(len(vertices)):
-                    x, y, z = vertices[i]
-                    vertices[i, 0] = x * scale_x  # Compress width from original
-                    vertices[i, 1] = y * scale_y  # Extend length from original
-                    vertices[i, 2] = z * scale_z  # Compress height from original
-                
-                if layer_idx == 0:
-                    logger.debug(f"  Layer 0 transformed vertex[0]: {vertices[0]}")
-                
-                # Update mesh with transformed vertices
-                layer.mesh.vertices = o3d.utility.Vector3dVector(vertices)
-                layer.mesh.compute_vertex_normals()
+            # Compress width (X), extend length (Y), compress height (Z)
+            scale = np.array([scale_x, scale_y, scale_z], dtype=original_vertices.dtype)
+            
+            # Transform every layer at once from the ORIGINAL vertices
+            vertices = original_vertices * scale
+            
+            if len(vertices):
+                if heat_num == 0:
+                    logger.debug("  Layer 0 original vertex[0]: %s", original_vertices[0, 0])
+                logger.debug("  Layer 0 transformed vertex[0]: %s", vertices[0, 0])
+            
+            # Update the billet's vertex tensor; layer meshes follow lazily
+            self.billet.set_vertices(vertices)
             
             # Update layer positions and thicknesses (from original values)
             for layer_idx, layer in enumerate(self.billet.layers):
@@ -1107,24 +1202,26 @@ class Damascus3DGUI:
                 layer.z_position = original_layer_z_pos[layer_idx] * scale_z
                 
                 if layer_idx < 2 and heat_num == num_heats - 1:
-                    logger.debug(f"  Layer {layer_idx} final: thickness={layer.thickness:.3f}mm, z_pos={layer.z_position:.3f}mm")
+                    logger.debug("  Layer %d final: thickness=%.3fmm, z_pos=%.3fmm", layer_idx, layer.thickness, layer.z_position)
         
         # Update billet dimensions
         self.billet.width = target_bar_size
         self.billet.length = final_length
+        self.billet.refresh_total_height()
         self.is_forged = True
         
         # CRITICAL DEBUG: Check if vertices were actually updated
-        logger.debug("POST-FORGING VERTEX CHECK:")
-        for layer_idx in [0, len(self.billet.layers)-1]:  # Check first and last layer
-            verts_check = np.asarray(self.billet.layers[layer_idx].mesh.vertices)
-            y_min = verts_check[:, 1].min()
-            y_max = verts_check[:, 1].max()
-            logger.debug(f"  Layer {layer_idx} Y range in mesh: [{y_min:.1f}, {y_max:.1f}]")
-            logger.debug(f"  Layer {layer_idx} expected Y range: [{-final_length/2:.1f}, {final_length/2:.1f}]")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("POST-FORGING VERTEX CHECK:")
+            for layer_idx in [0, len(self.billet.layers)-1]:  # Check first and last layer
+                verts_check = self.billet.vertices[layer_idx]
+                y_min = verts_check[:, 1].min()
+                y_max = verts_check[:, 1].max()
+                logger.debug("  Layer %d Y range in mesh: [%.1f, %.1f]", layer_idx, y_min, y_max)
+                logger.debug("  Layer %d expected Y range: [%.1f, %.1f]", layer_idx, -final_length/2, final_length/2)
         
         # Verify volume conservation
-        final_height = sum(l.thickness for l in self.billet.layers)
+        final_height = self.billet.total_height
         final_volume = self.billet.width * self.billet.length * final_height
         volume_ratio = final_volume / original_volume
         
@@ -1185,7 +1282,7 @@ class Damascus3DGUI:
         dialog.grab_set()
         
         # Current dimensions info
-        current_height = sum(l.thickness for l in self.billet.layers)
+        current_height = self.billet.total_height
         current_volume = self.billet.width * self.billet.length * current_height
         
         info_frame = ttk.LabelFrame(dialog, text="Current Billet", padding=10)
@@ -1369,9 +1466,7 @@ class Damascus3DGUI:
         
         # Store original vertex positions BEFORE any transformation
         logger.debug(f"Storing original vertex positions for {len(self.billet.layers)} layers...")
-        original_vertices = []
-        for layer in self.billet.layers:
-            original_vertices.append(np.asarray(layer.mesh.vertices).copy())
+        original_vertices = self.billet.vertices.copy()  # (N_layers, 8, 3) snapshot
         
         # Store original layer properties
         original_layer_thickness = [layer.thickness for layer in self.billet.layers]
@@ -1398,53 +1493,31 @@ class Damascus3DGUI:
             # Chamfer factor increases with progress
             current_chamfer = chamfer_percent * progress
             
-            logger.debug(f"  Cumulative scale from original: X={scale_x:.3f}, Y={scale_y:.3f}, Z={scale_z:.3f}, Chamfer={current_chamfer:.3f}")
+            logger.debug("  Cumulative scale from original: X=%.3f, Y=%.3f, Z=%.3f, Chamfer=%.3f", scale_x, scale_y, scale_z, current_chamfer)
             
-            # Apply to each layer (transform from ORIGINAL vertices)
-            chamfered_vertices_count = 0
-            for layer_idx, layer in enumerate(self.billet.layers):
-                # Get ORIGINAL vertices for this layer
-                vertices = original_vertices[layer_idx].copy()
-                layer_chamfered = 0
-                
-                if layer_idx == 0 and heat_num == 0:
-                    logger.debug(f"  Layer 0 original vertex[0]: {vertices[0]}")
-                
-                # Apply transformation from original positions
-                for i in range(len(vertices)):
-                    x, y, z = vertices[i]
-                    
-                    # Apply forging transformation from original
-                    x_forged = x * scale_x
-                    y_forged = y * scale_y
-                    z_forged = z * scale_z
-                    
-                    # Apply chamfer to corners (creates octagon from square)
-                    abs_x = abs(x_forged)
-                    abs_y = abs(y_forged)
-                    corner_threshold = target_width / 2 - (target_width * current_chamfer)
-                    
-                    if abs_x > corner_threshold and abs_y > corner_threshold:
-                        # Vertex is in corner - chamfer it
-                        chamfer_scale = 1.0 - current_chamfer
-                        x_forged *= chamfer_scale
-                        y_forged *= chamfer_scale
-                        layer_chamfered += 1
-                    
-                    vertices[i, 0] = x_forged
-                    vertices[i, 1] = y_forged
-                    vertices[i, 2] = z_forged
-                
-                if layer_idx == 0:
-                    logger.debug(f"  Layer 0 transformed vertex[0]: {vertices[0]}")
-                
-                chamfered_vertices_count += layer_chamfered
-                
-                # Update mesh with transformed vertices
-                layer.mesh.vertices = o3d.utility.Vector3dVector(vertices)
-                layer.mesh.compute_vertex_normals()
+            scale = np.array([scale_x, scale_y, scale_z], dtype=original_vertices.dtype)
+            corner_threshold = target_width / 2 - (target_width * current_chamfer)
+            chamfer_scale = 1.0 - current_chamfer
+            
+            # Apply forging transformation to every layer at once from the
+            # ORIGINAL vertices
+            vertices = original_vertices * scale
+            
+            # Apply chamfer to corners (creates octagon from square)
+            in_corner = ((np.abs(vertices[:, :, 0]) > corner_threshold) &
+                         (np.abs(vertices[:, :, 1]) > corner_threshold))
+            vertices[in_corner, :2] *= chamfer_scale
+            chamfered_vertices_count = int(np.count_nonzero(in_corner))
             
-            logger.debug(f"  Chamfered vertices this heat: {chamfered_vertices_count}")
+            if len(vertices):
+                if heat_num == 0:
+                    logger.debug("  Layer 0 original vertex[0]: %s", original_vertices[0, 0])
+                logger.debug("  Layer 0 transformed vertex[0]: %s", vertices[0, 0])
+            
+            # Update the billet's vertex tensor; layer meshes follow lazily
+            self.billet.set_vertices(vertices)
+            
+            logger.debug("  Chamfered vertices this heat: %d", chamfered_vertices_count)
             
             # Update layer positions and thicknesses (from original values)
             for layer_idx, layer in enumerate(self.billet.layers):
@@ -1452,24 +1525,26 @@ class Damascus3DGUI:
                 layer.z_position = original_layer_z_pos[layer_idx] * scale_z
                 
                 if layer_idx < 2 and heat_num == num_heats - 1:
-                    logger.debug(f"  Layer {layer_idx} final: thickness={layer.thickness:.3f}mm, z_pos={layer.z_position:.3f}mm")
+                    logger.debug("  Layer %d final: thickness=%.3fmm, z_pos=%.3fmm", layer_idx, layer.thickness, layer.z_position)
         
         # Update billet dimensions
         self.billet.width = target_bar_size
         self.billet.length = final_length
+        self.billet.refresh_total_height()
         self.is_forged = True
         
         # CRITICAL DEBUG: Check if vertices were actually updated
-        logger.debug("POST-FORGING VERTEX CHECK:")
-        for layer_idx in [0, len(self.billet.layers)-1]:  # Check first and last layer
-            verts_check = np.asarray(self.billet.layers[layer_idx].mesh.vertices)
-            y_min = verts_check[:, 1].min()
-            y_max = verts_check[:, 1].max()
-            logger.debug(f"  Layer {layer_idx} Y range in mesh: [{y_min:.1f}, {y_max:.1f}]")
-            logger.debug(f"  Layer {layer_idx} expected Y range: [{-final_length/2:.1f}, {final_length/2:.1f}]")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("POST-FORGING VERTEX CHECK:")
+            for layer_idx in [0, len(self.billet.layers)-1]:  # Check first and last layer
+                verts_check = self.billet.vertices[layer_idx]
+                y_min = verts_check[:, 1].min()
+                y_max = verts_check[:, 1].max()
+                logger.debug("  Layer %d Y range in mesh: [%.1f, %.1f]", layer_idx, y_min, y_max)
+                logger.debug("  Layer %d expected Y range: [%.1f, %.1f]", layer_idx, -final_length/2, final_length/2)
         
         # Verify volume conservation
-        final_height = sum(l.thickness for l in self.billet.layers)
+        final_height = self.billet.total_height
         final_volume = self.billet.width * self.billet.length * final_height * 0.95  # Octagon area approximation
         volume_ratio = final_volume / original_volume
         
@@ -1517,48 +1592,70 @@ class Damascus3DGUI:
     # VISUALIZATION UPDATES
     # ========================================================================
     
+    def _schedule_3d_view_update(self):
+        """
+        Queue a 3D viewport redraw, coalescing bursts of requests.
+        
+        View sliders and wheel zoom fire far faster than the viewport can
+        render. While a redraw is queued further requests are dropped; it
+        runs on the next ~60 Hz tick and picks up the latest view settings.
+        """
+        if self._pending_3d_view_update is None:
+            self._pending_3d_view_update = self.root.after(16, self._run_scheduled_3d_view_update)
+    
+    def _run_scheduled_3d_view_update(self):
+        """Run the redraw queued by _schedule_3d_view_update()."""
+        self._pending_3d_view_update = None
+        self.update_3d_view()
+    
     def update_3d_view(self):
         """Update the 3D viewport with current billet state."""
         if self.billet is None:
             return
         
-        logger.debug(f"Updating 3D viewport - Billet: {self.billet.width:.1f}W x {self.billet.length:.1f}L, {len(self.billet.layers)} layers")
+        logger.debug("Updating 3D viewport - Billet: %.1fW x %.1fL, %d layers", self.billet.width, self.billet.length, len(self.billet.layers))
         self.status_text.set("Rendering 3D view...")
         self.root.update()
         
         # Clear previous plot
         self.ax_3d.clear()
         
-        # Render each layer
-        total_vertices = 0
-        total_triangles = 0
-        for layer_idx, layer in enumerate(self.billet.layers):
-            vertices = np.asarray(layer.mesh.vertices)
-            triangles = np.asarray(layer.mesh.triangles)
-            
-            total_vertices += len(vertices)
-            total_triangles += len(triangles)
-            
-            # Debug first and last layer bounds
-            if layer_idx == 0 or layer_idx == len(self.billet.layers) - 1:
-                v_min = vertices.min(axis=0)
-                v_max = vertices.max(axis=0)
-                logger.debug(f"  Layer {layer_idx} bounds: X[{v_min[0]:.1f},{v_max[0]:.1f}] Y[{v_min[1]:.1f},{v_max[1]:.1f}] Z[{v_min[2]:.1f},{v_max[2]:.1f}]")
-            
-            # Create faces from triangles
-            faces = vertices[triangles]
-            
-            # Create 3D polygon collection
+        # Rotating, zooming or resizing the build plate leaves the billet
+        # untouched, so the gathered faces are reused until a layer's
+        # geometry stamp changes
+        layers = self.billet.layers
+        geometry_key = tuple(layer.geometry_stamp for layer in layers)
+        if self._3d_geometry_cache is None or self._3d_geometry_cache[0] != geometry_key:
+            if layers and logger.isEnabledFor(logging.DEBUG):
+                # Debug first and last layer bounds
+                for layer_idx in sorted({0, len(layers) - 1}):
+                    v_min = layers[layer_idx].vertices.min(axis=0)
+                    v_max = layers[layer_idx].vertices.max(axis=0)
+                    logger.debug("  Layer %d bounds: X[%.1f,%.1f] Y[%.1f,%.1f] Z[%.1f,%.1f]", layer_idx, v_min[0], v_max[0], v_min[1], v_max[1], v_min[2], v_max[2])
+            
+            if layers:
+                faces, facecolors = self.billet.get_faces_and_colors()
+            else:
+                faces = facecolors = None
+            self._3d_geometry_cache = (geometry_key, faces, facecolors)
+        
+        _, faces, facecolors = self._3d_geometry_cache
+        total_vertices = sum(len(layer.vertices) for layer in layers)
+        total_triangles = 0 if faces is None else len(faces)
+        
+        # One collection for the whole billet keeps pan/rotate redraws cheap:
+        # matplotlib sorts and composites per collection, not per polygon batch
+        if faces is not None:
             poly_collection = Poly3DCollection(
                 faces,
-                facecolors=layer.color,
+                facecolors=facecolors,
                 edgecolors='black',
                 linewidths=0.1,
                 alpha=0.95
             )
             self.ax_3d.add_collection3d(poly_collection)
         
-        logger.debug(f"  Rendered {len(self.billet.layers)} layers, {total_vertices} vertices, {total_triangles} triangles")
+        logger.debug("  Rendered %d layers, %d vertices, %d triangles", len(self.billet.layers), total_vertices, total_triangles)
         
         # Draw build plate boundary at Z=0
         plate_w = self.build_plate_width.get()
@@ -1576,7 +1673,7 @@ class Damascus3DGUI:
         self.ax_3d.plot(plate_corners[:, 0], plate_corners[:, 1], plate_corners[:, 2],
                        color='#888888', linewidth=2, linestyle='--', alpha=0.6, label='Build Plate')
         
-        logger.debug(f"  Drew build plate boundary: {plate_w}x{plate_l}mm")
+        logger.debug("  Drew build plate boundary: %sx%smm", plate_w, plate_l)
         
         # Set axis labels and limits
         # NEW COORDINATE SYSTEM: X=width, Y=length, Z=height (layers stack in Z)
@@ -1588,10 +1685,10 @@ class Damascus3DGUI:
         # This provides a consistent reference frame regardless of billet size
         plate_width = self.build_plate_width.get()
         plate_length = self.build_plate_length.get()
-        height = sum(l.thickness for l in self.billet.layers)
+        height = self.billet.total_height
         
-        logger.debug(f"  Billet dimensions: W={self.billet.width:.1f}, L={self.billet.length:.1f}, H={height:.1f}")
-        logger.debug(f"  Build plate: W={plate_width:.1f}, L={plate_length:.1f}")
+        logger.debug("  Billet dimensions: W=%.1f, L=%.1f, H=%.1f", self.billet.width, self.billet.length, height)
+        logger.debug("  Build plate: W=%.1f, L=%.1f", plate_width, plate_length)
         
         # Viewport shows the build plate area with slight padding
         padding_factor = 1.1  # Only 10% padding since build plate is already spacious
@@ -1607,14 +1704,14 @@ class Damascus3DGUI:
             y_range /= zoom
             z_range /= zoom
         
-        logger.debug(f"  Viewport ranges (build plate, zoom={zoom:.2f}): X={x_range:.1f}, Y={y_range:.1f}, Z={z_range:.1f}")
+        logger.debug("  Viewport ranges (build plate, zoom=%.2f): X=%.1f, Y=%.1f, Z=%.1f", zoom, x_range, y_range, z_range)
         
         # Set limits - billet centered at origin in X and Y, Z starts at 0 (build plate)
         self.ax_3d.set_xlim(-x_range/2, x_range/2)
         self.ax_3d.set_ylim(-y_range/2, y_range/2)
         self.ax_3d.set_zlim(0, z_range)
         
-        logger.debug(f"  Axis limits: X=[{-x_range/2:.1f},{x_range/2:.1f}] Y=[{-y_range/2:.1f},{y_range/2:.1f}] Z=[0,{z_range:.1f}]")
+        logger.debug("  Axis limits: X=[%.1f,%.1f] Y=[%.1f,%.1f] Z=[0,%.1f]", -x_range/2, x_range/2, -y_range/2, y_range/2, z_range)
         
         # Set view angle from controls
         self.ax_3d.view_init(elev=self.view_elevation.get(), azim=self.view_azimuth.get())
@@ -1627,7 +1724,7 @@ class Damascus3DGUI:
             aspect_l = self.billet.length 
             aspect_h = height
             self.ax_3d.set_box_aspect([aspect_w, aspect_l, aspect_h])
-            logger.debug(f"  Set box aspect ratio (billet proportions): [{aspect_w:.1f}, {aspect_l:.1f}, {aspect_h:.1f}]")
+            logger.debug("  Set box aspect ratio (billet proportions): [%.1f, %.1f, %.1f]", aspect_w, aspect_l, aspect_h)
         except AttributeError:
             # Older matplotlib versions don't have set_box_aspect
             logger.warning("  set_box_aspect not available - aspect ratio may be distorted")
@@ -1638,18 +1735,18 @@ class Damascus3DGUI:
         self.ax_3d.grid(True, alpha=0.3)
         
         # Redraw
-        logger.debug(f"  Drawing canvas...")
+        logger.debug("  Drawing canvas...")
         self.canvas_3d.draw()
         
         self.status_text.set("3D view updated")
-        logger.debug(f"3D viewport rendered (elev={self.view_elevation.get():.1f}°, azim={self.view_azimuth.get():.1f}°)")
+        logger.debug("3D viewport rendered (elev=%.1f°, azim=%.1f°)", self.view_elevation.get(), self.view_azimuth.get())
     
     def update_cross_section(self):
         """Update the cross-section preview."""
         if self.billet is None:
             return
         
-        logger.debug(f"Updating cross-section at Z={self.z_position.get():.1f}mm")
+        logger.debug("Updating cross-section at Z=%.1fmm", self.z_position.get())
         self.status_text.set("Extracting cross-section...")
         self.root.update()
         
@@ -1661,28 +1758,32 @@ class Damascus3DGUI:
             debug=False
         )
         
-        # Convert to PIL Image
-        self.cross_section_image = Image.fromarray(cross_section_array)
-        
         # Display on canvas
         canvas_width = self.xsection_canvas.winfo_width()
         canvas_height = self.xsection_canvas.winfo_height()
         
         if canvas_width > 1 and canvas_height > 1:
-            # Resize to fit canvas
-            display_img = self.cross_section_image.resize(
-                (canvas_width, canvas_height),
-                Image.Resampling.LANCZOS
-            )
-            
-            self.cross_section_display = ImageTk.PhotoImage(display_img)
-            
-            # Clear and redraw
-            self.xsection_canvas.delete("all")
-            self.xsection_canvas.create_image(
-                canvas_width//2, canvas_height//2,
-                image=self.cross_section_display
-            )
+            # Resize to fit canvas; only the resized preview outlives this call
+            display_img = _resize_grayscale_image(cross_section_array, (canvas_width, canvas_height))
+            
+            # Paste into the existing Tk image when the canvas size is
+            # unchanged; a new one is only allocated after a resize
+            display = self.cross_section_display
+            if display is not None and (display.width(), display.height()) == display_img.size:
+                display.paste(display_img)
+            else:
+                self.cross_section_display = ImageTk.PhotoImage(display_img)
+            
+            # Draw: the canvas item is created once, later updates just
+            # recentre it and swap in the new image
+            if self.cross_section_item is None:
+                self.cross_section_item = self.xsection_canvas.create_image(
+                    canvas_width//2, canvas_height//2,
+                    image=self.cross_section_display
+                )
+            else:
+                self.xsection_canvas.coords(self.cross_section_item, canvas_width//2, canvas_height//2)
+                self.xsection_canvas.itemconfig(self.cross_section_item, image=self.cross_section_display)
         
         self.status_text.set(f"Cross-section at Z={z_pos:.1f}mm")
         logger.debug("Cross-section updated")
@@ -1724,10 +1825,10 @@ class Damascus3DGUI:
         
         self.zoom_scale.set(new_zoom)
         
-        logger.debug(f"Mouse scroll zoom {direction}: {current_zoom:.2f} -> {new_zoom:.2f}")
+        logger.debug("Mouse scroll zoom %s: %.2f -> %.2f", direction, current_zoom, new_zoom)
         
         # Update viewport with new zoom
-        self.update_3d_view()
+        self._schedule_3d_view_update()
         self.status_text.set(f"Zoom: {new_zoom:.2f}x")
     
     def set_top_view(self):
@@ -1877,7 +1978,7 @@ class Damascus3DGUI:
         if self.billet:
             layer_count = len(self.billet.layers)
             op_count = len(self.billet.operation_history)
-            height = sum(l.thickness for l in self.billet.layers)
+            height = self.billet.total_height
             self.stats_text.set(f"Layers: {layer_count} | Operations: {op_count}")
             logger.debug(f"Status updated: {layer_count} layers, {op_count} ops, {self.billet.width:.1f}x{self.billet.length:.1f}x{height:.1f}mm")
     
@@ -1912,7 +2013,10 @@ class Damascus3DGUI:
         text_area.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.debug_console_text = text_area
 
-        # Preload the latest log file so context is visible immediately.
+        # Preload the latest log file so context is visible immediately
+        # (writing out any records still buffered for it first).
+        for handler in logger.handlers:
+            handler.flush()
         SIM_LOGS_DIR.mkdir(parents=True, exist_ok=True)
         log_files = sorted(SIM_LOGS_DIR.glob('damascus_3d_debug_*.log'), reverse=True)
         logger.debug(f"Found {len(log_files)} debug log files")
@@ -1920,7 +2024,7 @@ class Damascus3DGUI:
             logger.debug(f"Loading most recent log: {log_files[0]}")
             with open(log_files[0], 'r', encoding='utf-8', errors='replace') as f:
                 # Keep startup fast by loading only the recent tail.
-                tail_lines = f.readlines()[-3000:]
+                tail_lines = f.readlines()[-TkTextLogHandler.MAX_LINES:]
                 text_area.insert(tk.END, ''.join(tail_lines))
             text_area.see(tk.END)
         else:
@@ -2192,9 +2296,7 @@ TIPS:
         steels = {}
         
         # Split by numbered sections (1., 2., 3., etc.) OR steel names like "15N20"
-        import re
-        # Match either numbered sections or 15N20-style headers
-        sections = re.split(r'((?:\d+\.\s+)?[A-Z0-9]+\s+[A-Z][A-Za-z\s\-/()]+(?:Steel|STEEL)?)', content)
+        sections = _STEEL_SECTION_SPLIT_RE.split(content)
         
         current_steel = None
         current_content = []
@@ -2206,10 +2308,10 @@ TIPS:
             # Check if this is a steel header
             # Numbered: "1. O1 OIL-HARDENING TOOL STEEL"
             # OR unnumbered: "15N20 High Nickel Alloy Steel"
-            if re.match(r'^(?:\d+\.\s+)?[A-Z0-9]+\s+[A-Z]', section):
+            if _STEEL_HEADER_RE.match(section):
                 # Save previous steel if exists
                 if current_steel:
-                    steel_name = re.sub(r'^\d+\.\s+', '', current_steel)
+                    steel_name = _SECTION_NUMBER_RE.sub('', current_steel)
                     steels[steel_name] = current_steel + "\n" + ''.join(current_content)
                 
                 # Start new steel
@@ -2222,7 +2324,7 @@ TIPS:
         
         # Save last steel
         if current_steel:
-            steel_name = re.sub(r'^\d+\.\s+', '', current_steel)
+            steel_name = _SECTION_NUMBER_RE.sub('', current_steel)
             steels[steel_name] = current_steel + "\n" + ''.join(current_content)
         
         return steels
@@ -2285,24 +2387,32 @@ TIPS:
     
     def _refresh_steel_list(self, listbox, db):
         """Refresh the steel listbox."""
-        listbox.delete(0, tk.END)
-        
         # Group by built-in and custom
-        builtin = [(k, s) for k, s in db.get_all_steels().items() if not s.is_custom]
-        custom = [(k, s) for k, s in db.get_all_steels().items() if s.is_custom]
+        builtin = []
+        custom = []
+        for steel in db.get_all_steels().values():
+            (custom if steel.is_custom else builtin).append(steel)
+        
+        # Build every row first: the listbox is then filled with a single
+        # insert (one Tk call) rather than one round trip per steel
+        rows = []
         
         # Add built-in steels
         if builtin:
-            listbox.insert(tk.END, "═══ BUILT-IN STEELS ═══")
-            for key, steel in sorted(builtin, key=lambda x: x[1].name):
-                listbox.insert(tk.END, f"  {steel.name} ({steel.category})")
+            rows.append("═══ BUILT-IN STEELS ═══")
+            rows.extend(f"  {steel.name} ({steel.category})"
+                        for steel in sorted(builtin, key=lambda s: s.name))
         
         # Add custom steels
         if custom:
-            listbox.insert(tk.END, "")
-            listbox.insert(tk.END, "═══ CUSTOM STEELS ═══")
-            for key, steel in sorted(custom, key=lambda x: x[1].name):
-                listbox.insert(tk.END, f"  ⭐ {steel.name} ({steel.category})")
+            rows.append("")
+            rows.append("═══ CUSTOM STEELS ═══")
+            rows.extend(f"  ⭐ {steel.name} ({steel.category})"
+                        for steel in sorted(custom, key=lambda s: s.name))
+        
+        listbox.delete(0, tk.END)
+        if rows:
+            listbox.insert(tk.END, *rows)
     
     def _submit_steel_via_email(self, listbox, db):
         """Export selected custom steel to zip file for email submission."""
@@ -2562,8 +2672,6 @@ TIPS:
             
             # Create Steel object
             try:
-                from data.steel_database import Steel
-                
                 # Build steel data dictionary
                 steel_data = {
                     'name': name,
@@ -2641,9 +2749,11 @@ TIPS:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind mousewheel
+        # (on the dialog only, so the main window's handler stays in place)
         def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+            canvas.yview_scroll(_wheel_scroll_units(event), "units")
+        for sequence in _WHEEL_EVENTS:
+            dialog.bind(sequence, on_mousewheel)
         
         logger.info("Add Custom Steel dialog created")
     
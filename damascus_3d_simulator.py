@@ -43,14 +43,44 @@ from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import functools
 import inspect
+import itertools
 import logging
+import logging.handlers
+import math
 import os
 import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
 import json
 from PIL import Image
 from pathlib import Path
 
+# orjson when installed (stdlib json otherwise) for the operation log
+from data.json_io import dumps_indented as _dumps_indented
+
+# Optional: Numba JIT-compiles the deformation and cross-section kernels
+# (NumPy fallback otherwise). Setting DAMASCUS_DISABLE_NUMBA=1 forces the
+# NumPy kernels, e.g. to cross-check results against the JIT path.
+if os.environ.get("DAMASCUS_DISABLE_NUMBA"):
+    numba = None
+    NUMBA_AVAILABLE = False
+else:
+    try:
+        import numba
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        numba = None
+        NUMBA_AVAILABLE = False
+
+# Optional: OpenCV encodes cross-section PNGs through libpng (PIL otherwise)
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    cv2 = None
+    CV2_AVAILABLE = False
+
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -120,8 +150,15 @@ def setup_logging(debug_level: str = "DEBUG") -> logging.Logger:
     )
     file_handler.setFormatter(file_format)
     
+    # The DEBUG stream is high-volume, so file writes are batched: records are
+    # held in memory and written out together when an INFO-or-worse record
+    # arrives, the buffer fills, or logging shuts down
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=512, flushLevel=logging.INFO, target=file_handler)
+    buffered_file_handler.setLevel(logging.DEBUG)
+    
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_file_handler)
     
     logger.info("="*70)
     logger.info("Damascus 3D Simulator - Debug Session Started")
@@ -134,6 +171,13 @@ def setup_logging(debug_level: str = "DEBUG") -> logging.Logger:
 
 # Initialize global logger
 logger = setup_logging("DEBUG")
+logger.debug("Kernel backend: %s", f"numba {numba.__version__}" if NUMBA_AVAILABLE else "numpy")
+
+# Upper bound on per-vertex sample lines a single operation writes to the log
+MAX_VERTEX_LOG_SAMPLES = 50
+
+# Recently extracted cross-sections kept per billet, see extract_cross_section()
+CROSS_SECTION_CACHE_SIZE = 8
 
 
 # ============================================================================
@@ -172,6 +216,443 @@ def _api_call_wrapper(func):
     return wrapped
 
 
+# ============================================================================
+# DEFORMATION KERNELS
+# ============================================================================
+#
+# Each kernel works in place on the billet's (N_layers, 8, 3) vertex tensor.
+# Per-layer inputs are 1-D arrays of length N_layers. The NumPy versions are
+# always available; when Numba is installed, equivalent loop kernels are
+# JIT-compiled (parallel, fastmath) and used instead.
+
+def _wedge_kernel_numpy(vertices, layer_position_normalized, center_x, sigma,
+                        wedge_depth, tan_angle, split_gap, downward, horizontal):
+    """
+    Apply wedge split displacements; write per-vertex Δz/Δx into downward/horizontal.
+    """
+    # Distance from wedge centerline
+    dx = vertices[:, :, 0] - center_x
+    
+    # Which side of the wedge? (-1 = left, +1 = right)
+    side = np.where(np.abs(dx) > 0.001, np.sign(dx), 1.0)
+    
+    # Loop invariants
+    two_sigma_sq = 2.0 * sigma * sigma
+    spread = split_gap + wedge_depth * tan_angle
+    
+    # Deformation intensity: maximum at center, falls off with distance
+    # Using smooth Gaussian falloff for realistic material flow.
+    # Scaled by the layer's normalized height (top layers move more).
+    weight = np.exp(-(dx * dx) / two_sigma_sq) * layer_position_normalized[:, np.newaxis]
+    
+    # DOWNWARD DISPLACEMENT (in -Z direction, since layers stack in Z)
+    # Layers are pulled down by wedge - creates waterfall
+    np.multiply(weight, -wedge_depth, out=downward)
+    
+    # HORIZONTAL DISPLACEMENT (in X direction)
+    # Wedge pushes layers outward - creates the split
+    # Two components: split gap + angle-induced spread
+    np.multiply(side * spread, weight, out=horizontal)
+    
+    # NEW COORDINATE SYSTEM: X=width, Y=length, Z=height (layers stack in Z)
+    vertices[:, :, 0] += horizontal  # X axis (width) - split
+    vertices[:, :, 2] += downward    # Z axis (height) - waterfall
+
+
+def _twist_kernel_numpy(vertices, angle_rad, length, z_center):
+    """
+    Rotate vertices in the XZ plane about each layer's mid-plane (Y-axis twist).
+    """
+    # Twist varies linearly along the length (Y-axis)
+    # y = -length/2 => no twist (0°), y = +length/2 => full twist
+    half_length = length / 2
+    angle_per_mm = angle_rad / length
+    current_angle = (vertices[:, :, 1] + half_length) * angle_per_mm
+    cos_a = np.cos(current_angle)
+    sin_a = np.sin(current_angle)
+    
+    # Translate to origin (x_center = 0), rotate, translate back
+    x_rel = vertices[:, :, 0].copy()
+    z_rel = vertices[:, :, 2] - z_center[:, np.newaxis]
+    vertices[:, :, 0] = x_rel * cos_a - z_rel * sin_a
+    vertices[:, :, 2] = x_rel * sin_a + z_rel * cos_a + z_center[:, np.newaxis]
+
+
+def _drill_kernel_numpy(vertices, holes, radius, dist):
+    """
+    Push vertices radially outward around each hole in turn; write XY distances into dist.
+    
+    holes is (H, 2) hole centres (x, y) and dist is (H, N_layers, 8); each
+    hole sees the vertices as left by the holes before it.
+    """
+    # Loop invariants
+    two_radius_sq = 2.0 * radius * radius
+    influence_radius = radius * 2.0
+    
+    for h in range(len(holes)):
+        x_pos, y_pos = holes[h].tolist()
+        hole_dist = dist[h]
+        
+        # Distance from hole center (in XY plane - horizontal)
+        dx = vertices[:, :, 0] - x_pos
+        dy = vertices[:, :, 1] - y_pos
+        np.hypot(dx, dy, out=hole_dist)
+        
+        # Inside the hole (dist < radius) - push outward strongly
+        # Outside but close (dist < 2×radius) - gentle push with smooth falloff
+        inside = hole_dist < radius
+        influence = np.exp(-((hole_dist - radius)**2) / two_radius_sq)
+        push_factor = np.where(inside, 1.5, influence * 0.3)
+        
+        # Push radially outward in XY plane, avoiding division by zero at exact center
+        moved = (hole_dist < influence_radius) & (hole_dist > 0.001)
+        scale = np.zeros_like(hole_dist)
+        scale[moved] = radius * push_factor[moved] / hole_dist[moved]
+        
+        vertices[:, :, 0] += dx * scale
+        vertices[:, :, 1] += dy * scale
+
+
+if NUMBA_AVAILABLE:
+    # Frozen builds have no writable source tree for Numba's on-disk cache
+    _NUMBA_CACHE = not getattr(sys, "frozen", False)
+    
+    @numba.njit(parallel=True, fastmath=True, cache=_NUMBA_CACHE)
+    def _wedge_kernel(vertices, layer_position_normalized, center_x, sigma,
+                      wedge_depth, tan_angle, split_gap, downward, horizontal):
+        """JIT version of _wedge_kernel_numpy."""
+        n_verts = vertices.shape[1]
+        spread = split_gap + wedge_depth * tan_angle
+        two_sigma_sq = 2.0 * sigma * sigma
+        for k in numba.prange(vertices.shape[0] * n_verts):
+            layer = k // n_verts
+            i = k % n_verts
+            dx = vertices[layer, i, 0] - center_x
+            side = -1.0 if dx < -0.001 else 1.0
+            weight = math.exp(-(dx * dx) / two_sigma_sq) * layer_position_normalized[layer]
+            downward[layer, i] = -wedge_depth * weight
+            horizontal[layer, i] = side * spread * weight
+            vertices[layer, i, 0] += horizontal[layer, i]
+            vertices[layer, i, 2] += downward[layer, i]
+    
+    @numba.njit(parallel=True, fastmath=True, cache=_NUMBA_CACHE)
+    def _twist_kernel(vertices, angle_rad, length, z_center):
+        """JIT version of _twist_kernel_numpy."""
+        n_verts = vertices.shape[1]
+        half_length = length / 2
+        angle_per_mm = angle_rad / length
+        for k in numba.prange(vertices.shape[0] * n_verts):
+            layer = k // n_verts
+            i = k % n_verts
+            current_angle = (vertices[layer, i, 1] + half_length) * angle_per_mm
+            cos_a = math.cos(current_angle)
+            sin_a = math.sin(current_angle)
+            x_rel = vertices[layer, i, 0]
+            z_rel = vertices[layer, i, 2] - z_center[layer]
+            vertices[layer, i, 0] = x_rel * cos_a - z_rel * sin_a
+            vertices[layer, i, 2] = x_rel * sin_a + z_rel * cos_a + z_center[layer]
+    
+    @numba.njit(parallel=True, fastmath=True, cache=_NUMBA_CACHE)
+    def _drill_kernel(vertices, holes, radius, dist):
+        """
+        JIT version of _drill_kernel_numpy.
+        
+        Vertices move independently, so every hole is applied to a vertex
+        while it is held: one pass over the tensor however many holes.
+        """
+        n_verts = vertices.shape[1]
+        two_radius_sq = 2.0 * radius * radius
+        influence_radius = radius * 2.0
+        for k in numba.prange(vertices.shape[0] * n_verts):
+            layer = k // n_verts
+            i = k % n_verts
+            for h in range(holes.shape[0]):
+                dx = vertices[layer, i, 0] - holes[h, 0]
+                dy = vertices[layer, i, 1] - holes[h, 1]
+                d = math.sqrt(dx * dx + dy * dy)
+                dist[h, layer, i] = d
+                if d < influence_radius and d > 0.001:
+                    if d < radius:
+                        push_factor = 1.5
+                    else:
+                        push_factor = math.exp(-((d - radius) ** 2) / two_radius_sq) * 0.3
+                    scale = radius * push_factor / d
+                    vertices[layer, i, 0] += dx * scale
+                    vertices[layer, i, 1] += dy * scale
+else:
+    _wedge_kernel = _wedge_kernel_numpy
+    _twist_kernel = _twist_kernel_numpy
+    _drill_kernel = _drill_kernel_numpy
+
+
+# ============================================================================
+# CROSS-SECTION KERNELS
+# ============================================================================
+#
+# A slice plane cuts each triangle it touches along a line segment. The
+# segment endpoints are found analytically on the triangle edges, mapped to
+# pixel space, and drawn into the cross-section image.
+
+# Triangle edges as (start corner, end corner)
+_EDGE_START = np.array([0, 1, 2])
+_EDGE_END = np.array([1, 2, 0])
+
+
+def _slice_triangles(faces, y_plane):
+    """
+    Intersect triangles with the plane Y = y_plane.
+    
+    Candidate points are the crossings of edges whose endpoints lie on
+    opposite sides of the plane, plus any corner lying exactly on it. The
+    first two candidates form the segment; a triangle that only touches the
+    plane at one point yields a zero-length segment.
+    
+    Args:
+        faces: (K, 3, 3) triangles that reach the plane
+        y_plane: Y position of the slice plane
+    
+    Returns:
+        (K, 2, 3) segment endpoints
+    """
+    s = faces[:, :, 1] - y_plane
+    s_start = s[:, _EDGE_START]
+    s_end = s[:, _EDGE_END]
+    
+    # Linear interpolation along each edge: p = a + t * (b - a)
+    # (edges parallel to the plane give inf/nan here and are masked out below)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = s_start / (s_start - s_end)
+        edge_points = faces[:, _EDGE_START] + t[:, :, np.newaxis] * (faces[:, _EDGE_END] - faces[:, _EDGE_START])
+    
+    points = np.concatenate([edge_points, faces], axis=1)
+    valid = np.concatenate([s_start * s_end < 0, s == 0], axis=1)
+    
+    # First two valid candidates per triangle (stable sort keeps edge order)
+    order = np.argsort(~valid, axis=1, kind='stable')[:, :2]
+    rows = np.arange(len(faces))[:, np.newaxis]
+    segments = points[rows, order]
+    
+    single = valid.sum(axis=1) < 2
+    segments[single, 1] = segments[single, 0]
+    return segments
+
+
+def _draw_segments(img, segments, colors):
+    """
+    Rasterize pixel-space segments into img.
+    
+    Each segment is sampled at one point per pixel step along its longer
+    axis. Coordinates are (column, height) with height measured from the
+    bottom of the image; rows are flipped for display. All samples are
+    written in one assignment, so where segments overlap the later one wins.
+    
+    Args:
+        img: (resolution, resolution) uint8 image, written in place
+        segments: (K, 2, 2) endpoints in continuous pixel coordinates
+        colors: (K,) gray value per segment
+    
+    Returns:
+        Number of pixel writes that landed inside the image
+    """
+    resolution = img.shape[0]
+    start = segments[:, 0]
+    delta = segments[:, 1] - start
+    
+    steps = np.ceil(np.abs(delta).max(axis=1)).astype(np.intp)
+    counts = steps + 1
+    
+    # Sample index within its own segment, for all segments at once
+    seg_idx = np.repeat(np.arange(len(segments)), counts)
+    first = np.cumsum(counts) - counts
+    k = np.arange(counts.sum()) - first[seg_idx]
+    t = k / np.maximum(steps, 1)[seg_idx]
+    
+    points = start[seg_idx] + t[:, np.newaxis] * delta[seg_idx]
+    px = np.floor(points[:, 0]).astype(np.intp)
+    pz = np.floor(points[:, 1]).astype(np.intp)
+    
+    in_bounds = (px >= 0) & (px < resolution) & (pz >= 0) & (pz < resolution)
+    img[resolution - 1 - pz[in_bounds], px[in_bounds]] = colors[seg_idx[in_bounds]]  # Flip Z for display
+    return int(np.count_nonzero(in_bounds))
+
+
+def _rasterize_slice_numpy(faces, colors, y_plane, x_min, x_scale, z_min, z_scale, img):
+    """
+    Cut triangles with the plane Y = y_plane and draw the segments into img.
+    
+    Scalars are passed in the dtype of `faces` so the cut and the pixel
+    mapping stay in that precision (float32 for billet geometry).
+    
+    Args:
+        faces: (K, 3, 3) triangles that reach the plane, in drawing order
+        colors: (K,) gray value per triangle
+        y_plane: Y position of the slice plane
+        x_min, x_scale: World X at the image's left edge, pixels per mm in X
+        z_min, z_scale: World Z at the image's bottom edge, pixels per mm in Z
+        img: (resolution, resolution) uint8 image, written in place
+    
+    Returns:
+        Number of pixel writes that landed inside the image
+    """
+    segments = _slice_triangles(faces, y_plane)
+    
+    # Map segment endpoints (X=width, Z=height) to pixel space
+    segments_px = np.empty(segments.shape[:2] + (2,), dtype=segments.dtype)
+    segments_px[:, :, 0] = (segments[:, :, 0] - x_min) * x_scale
+    segments_px[:, :, 1] = (segments[:, :, 2] - z_min) * z_scale
+    
+    return _draw_segments(img, segments_px, colors)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=_NUMBA_CACHE)
+    def _rasterize_slice(faces, colors, y_plane, x_min, x_scale, z_min, z_scale, img):
+        """
+        JIT version of _rasterize_slice_numpy.
+        
+        Cuts, maps and draws one triangle at a time with no temporaries.
+        Serial on purpose: triangles are drawn in order so later layers win.
+        No fastmath: reassociated float32 arithmetic would round boundary
+        pixels differently from the NumPy path.
+        """
+        n_pixels = img.shape[0]
+        pixels = 0
+        seg = np.empty((2, 2), dtype=faces.dtype)
+        for f in range(faces.shape[0]):
+            # Collect up to two cut points: edge crossings, then corners on the plane
+            n_points = 0
+            for e in range(3):
+                a = e
+                b = (e + 1) % 3
+                s_a = faces[f, a, 1] - y_plane
+                s_b = faces[f, b, 1] - y_plane
+                if s_a * s_b < 0 and n_points < 2:
+                    t = s_a / (s_a - s_b)
+                    seg[n_points, 0] = faces[f, a, 0] + t * (faces[f, b, 0] - faces[f, a, 0])
+                    seg[n_points, 1] = faces[f, a, 2] + t * (faces[f, b, 2] - faces[f, a, 2])
+                    n_points += 1
+            for c in range(3):
+                if faces[f, c, 1] - y_plane == 0 and n_points < 2:
+                    seg[n_points, 0] = faces[f, c, 0]
+                    seg[n_points, 1] = faces[f, c, 2]
+                    n_points += 1
+            if n_points == 0:
+                continue
+            if n_points == 1:
+                seg[1, 0] = seg[0, 0]
+                seg[1, 1] = seg[0, 1]
+            
+            # Pixel space, then one sample per step along the longer axis
+            x0 = (seg[0, 0] - x_min) * x_scale
+            z0 = (seg[0, 1] - z_min) * z_scale
+            dx = (seg[1, 0] - x_min) * x_scale - x0
+            dz = (seg[1, 1] - z_min) * z_scale - z0
+            steps = int(math.ceil(max(abs(dx), abs(dz))))
+            denom = max(steps, 1)
+            for k in range(steps + 1):
+                t = k / denom
+                px = int(math.floor(x0 + t * dx))
+                pz = int(math.floor(z0 + t * dz))
+                if 0 <= px < n_pixels and 0 <= pz < n_pixels:
+                    img[n_pixels - 1 - pz, px] = colors[f]  # Flip Z for display
+                    pixels += 1
+        return pixels
+else:
+    _rasterize_slice = _rasterize_slice_numpy
+
+
+# zlib level for cross-section PNGs: two-tone images compress well even at
+# the fastest level, and encoding dominates saving large slices
+_PNG_COMPRESS_LEVEL = 1
+
+
+def _write_grayscale_image(img: np.ndarray, output_path: str):
+    """
+    Save a uint8 grayscale image, format chosen by the file extension.
+    
+    PNGs go through OpenCV when it is installed; the image is encoded in
+    memory and written with Python file IO, so any path Python can open
+    works. Everything else, and PNGs without OpenCV, is saved with PIL.
+    """
+    is_png = Path(output_path).suffix.lower() == '.png'
+    if is_png and CV2_AVAILABLE:
+        ok, encoded = cv2.imencode('.png', img, [cv2.IMWRITE_PNG_COMPRESSION, _PNG_COMPRESS_LEVEL])
+        if ok:
+            Path(output_path).write_bytes(encoded.tobytes())
+            return
+    if is_png:
+        Image.fromarray(img).save(output_path, compress_level=_PNG_COMPRESS_LEVEL)
+    else:
+        Image.fromarray(img).save(output_path)
+
+
+# ============================================================================
+# BOX MESH TOPOLOGY
+# ============================================================================
+
+# Working precision for vertex buffers. float32 is ample for a billet a few
+# hundred mm across and halves memory traffic in the deformation kernels;
+# positions are widened to float64 only when handed to Open3D.
+VERTEX_DTYPE = np.float32
+
+# Every layer is a box, so its topology is known up front: 8 vertices and
+# 12 triangles. The tables below reproduce the vertex and triangle order of
+# o3d.geometry.TriangleMesh.create_box exactly, for a unit box, so layer
+# meshes can be built directly without going through the primitive factory.
+_BOX_VERTICES = np.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0],
+    [1.0, 0.0, 1.0],
+    [0.0, 1.0, 0.0],
+    [1.0, 1.0, 0.0],
+    [0.0, 1.0, 1.0],
+    [1.0, 1.0, 1.0],
+], dtype=np.float64)
+
+_BOX_TRIANGLES = np.array([
+    [4, 7, 5], [4, 6, 7],
+    [0, 2, 4], [2, 6, 4],
+    [0, 1, 2], [1, 3, 2],
+    [1, 5, 7], [1, 7, 3],
+    [2, 3, 7], [2, 7, 6],
+    [0, 4, 1], [1, 4, 5],
+], dtype=np.int32)
+
+
+def warm_up_kernels():
+    """
+    Compile the Numba kernels ahead of their first real use.
+    
+    Runs each kernel once on a single dummy layer, with argument types
+    matching the billet's own calls, so the first deformation or slice in an
+    interactive session doesn't stall on JIT compilation (or on loading the
+    on-disk cache). Does nothing when the NumPy kernels are in use.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    
+    start_time = time.perf_counter()
+    vertices = np.zeros((1, len(_BOX_VERTICES), 3), dtype=VERTEX_DTYPE)
+    per_layer = np.zeros(1, dtype=VERTEX_DTYPE)
+    per_vertex = np.empty(vertices.shape[:2], dtype=VERTEX_DTYPE)
+    
+    _wedge_kernel(vertices, per_layer, 0.0, 1.0, 0.0, 0.0, 0.0, per_vertex, per_vertex)
+    _twist_kernel(vertices, 0.0, 1.0, per_layer)
+    _drill_kernel(vertices, np.zeros((1, 2)), 1.0, per_vertex[np.newaxis])
+    
+    faces = vertices[0][_BOX_TRIANGLES]
+    zero = VERTEX_DTYPE(0)
+    _rasterize_slice(faces, np.zeros(len(faces), dtype=np.uint8), zero, zero, zero, zero, zero,
+                     np.zeros((1, 1), dtype=np.uint8))
+    
+    logger.debug("Numba kernels ready in %.2fs", time.perf_counter() - start_time)
+
+
+# Source of DamascusLayer.geometry_stamp values
+_GEOMETRY_STAMPS = itertools.count()
+
+
 # ============================================================================
 # DAMASCUS LAYER CLASS
 # ============================================================================
@@ -195,7 +676,8 @@ class DamascusLayer:
     """
     
     def __init__(self, z_position: float, thickness: float, color: Tuple[float, float, float], 
-                 width: float = 50.0, length: float = 100.0, layer_index: int = 0):
+                 width: float = 50.0, length: float = 100.0, layer_index: int = 0,
+                 vertices: Optional[np.ndarray] = None):
         """
         Create a Damascus layer as a 3D mesh.
         
@@ -206,6 +688,9 @@ class DamascusLayer:
             width: Width of the billet (mm)
             length: Length of the billet (mm)
             layer_index: Index of this layer in the stack (for debugging)
+            vertices: Optional (8, 3) buffer to hold this layer's vertex positions.
+                      Damascus3DBillet passes a view into its contiguous vertex
+                      tensor; a standalone layer allocates its own.
         """
         self.layer_index = layer_index
         self.z_position = z_position
@@ -221,14 +706,35 @@ class DamascusLayer:
         # Deformation history for debugging
         self.deformation_history: List[Dict[str, Any]] = []
         
-        logger.debug(f"Creating Layer #{layer_index}: z={z_position:.2f}mm, "
-                    f"thickness={thickness:.2f}mm, color={'WHITE' if color[0] > 0.5 else 'BLACK'}")
+        # Working vertex positions (source of truth for deformations)
+        if vertices is None:
+            vertices = np.empty((len(_BOX_VERTICES), 3), dtype=VERTEX_DTYPE)
+        self.vertices = vertices
+        
+        logger.debug("Creating Layer #%d: z=%.2fmm, thickness=%.2fmm, color=%s",
+                     layer_index, z_position, thickness, 'WHITE' if color[0] > 0.5 else 'BLACK')
+        
+        # Create the mesh as a rectangular box (always 8 vertices, 12 triangles)
+        self._mesh = self._create_layer_mesh()
+        
+        # Topology never changes after creation; deformations only move vertices
+        self.n_vertices = len(self.vertices)
+        self.n_triangles = len(_BOX_TRIANGLES)
         
-        # Create the mesh as a rectangular box
-        self.mesh = self._create_layer_mesh()
+        # Set when `vertices` changes; the mesh is refreshed on next access
+        self._mesh_dirty = False
         
-        logger.debug(f"Layer #{layer_index} mesh created: "
-                    f"{len(self.mesh.vertices)} vertices, {len(self.mesh.triangles)} triangles")
+        # Set alongside _mesh_dirty; normals are only rebuilt by get_mesh()
+        self._normals_dirty = False
+        
+        # Cached (min, max) extent along the slicing axis (Y), see _get_y_bounds()
+        self._y_bounds: Optional[Tuple[float, float]] = None
+        # Cached per-triangle corner positions (12, 3, 3), see _get_faces()
+        self._faces: Optional[np.ndarray] = None
+        
+        # Process-wide unique stamp, renewed on every vertex change; lets
+        # callers tell whether the geometry moved since they last looked
+        self.geometry_stamp = next(_GEOMETRY_STAMPS)
         
     def _create_layer_mesh(self) -> o3d.geometry.TriangleMesh:
         """
@@ -236,7 +742,8 @@ class DamascusLayer:
         
         TECHNICAL DETAILS:
         -----------------
-        - Uses Open3D's create_box primitive
+        - Built directly from the precomputed unit-box tables (8 vertices,
+          12 triangles) instead of Open3D's create_box primitive
         - Box dimensions: width x length x thickness
         - HORIZONTAL ORIENTATION: Layers stack in Z-axis (height)
         - Centered at X=0, Y=0, positioned at z_position in Z
@@ -245,23 +752,22 @@ class DamascusLayer:
         Returns:
             Open3D TriangleMesh object
         """
-        logger.debug(f"Creating box mesh: {self.width}x{self.length}x{self.thickness} mm (W x L x H)")
-        
-        # Create a box mesh for the layer
-        # IMPORTANT: width x length x thickness (horizontal orientation)
-        mesh = o3d.geometry.TriangleMesh.create_box(
-            width=self.width,
-            height=self.length,
-            depth=self.thickness
-        )
+        logger.debug("Creating box mesh: %sx%sx%s mm (W x L x H)", self.width, self.length, self.thickness)
         
-        # Position: centered in X and Y, stacked in Z (height)
+        # Scale the unit box to width x length x thickness and position it
+        # in one step (horizontal orientation):
         # X: width (centered at 0)
         # Y: length (centered at 0) 
         # Z: height (layers stack upward from z=0)
-        translation = [-self.width/2, -self.length/2, self.z_position]
-        logger.debug(f"Translating mesh by: {translation}")
-        mesh.translate(translation)
+        scale = np.array([self.width, self.length, self.thickness])
+        translation = np.array([-self.width/2, -self.length/2, self.z_position])
+        np.multiply(_BOX_VERTICES, scale, out=self.vertices)
+        self.vertices += translation
+        
+        mesh = o3d.geometry.TriangleMesh(
+            o3d.utility.Vector3dVector(self.vertices.astype(np.float64)),
+            o3d.utility.Vector3iVector(_BOX_TRIANGLES)
+        )
         
         # Apply color
         mesh.paint_uniform_color(self.color)
@@ -271,9 +777,79 @@ class DamascusLayer:
         
         return mesh
     
+    @property
+    def mesh(self) -> o3d.geometry.TriangleMesh:
+        """
+        Open3D mesh for this layer.
+        
+        Deformations only touch the `vertices` buffer; the mesh copy is
+        refreshed lazily here, so a chain of operations pays for a single
+        Vector3dVector conversion when the geometry is actually consumed.
+        Vertex normals may be stale; use get_mesh() for rendering/export.
+        """
+        if self._mesh_dirty:
+            self._sync_mesh()
+        return self._mesh
+    
     def get_mesh(self) -> o3d.geometry.TriangleMesh:
-        """Get the Open3D mesh for this layer."""
-        return self.mesh
+        """Get the Open3D mesh for this layer, with vertex normals up to date."""
+        mesh = self.mesh
+        if self._normals_dirty:
+            mesh.compute_vertex_normals()
+            self._normals_dirty = False
+        return mesh
+    
+    def _get_np_geometry(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get this layer's geometry as NumPy arrays without going through Open3D.
+        
+        Returns the working vertex buffer itself (a view, always current) and
+        the shared box triangle table, so no copy is made and nothing needs
+        invalidating. Treat both as read-only; use
+        Damascus3DBillet.set_vertices() to modify.
+        
+        Returns:
+            (vertices (8, 3), triangles (12, 3)) tuple
+        """
+        return self.vertices, _BOX_TRIANGLES
+    
+    def _invalidate_mesh(self):
+        """Mark the Open3D mesh as stale after the vertex buffer changed."""
+        self._mesh_dirty = True
+        self._normals_dirty = True
+        self._y_bounds = None
+        self._faces = None
+        self.geometry_stamp = next(_GEOMETRY_STAMPS)
+    
+    def _get_faces(self) -> np.ndarray:
+        """
+        Get the corner positions of every triangle, shape (12, 3, 3).
+        
+        This is the vertices[triangles] gather that cross-sections work on;
+        it is cached until the next deformation so repeated slices of an
+        unchanged billet reuse it. Treat as read-only.
+        """
+        if self._faces is None:
+            self._faces = self.vertices[_BOX_TRIANGLES]
+        return self._faces
+    
+    def _get_y_bounds(self) -> Tuple[float, float]:
+        """
+        Get the (min, max) extent of this layer along Y.
+        
+        Cross-sections slice along Y, so this lets a slice skip the whole
+        layer without touching its triangles. Cached until the next
+        deformation.
+        """
+        if self._y_bounds is None:
+            y = self.vertices[:, 1]
+            self._y_bounds = (float(y.min()), float(y.max()))
+        return self._y_bounds
+    
+    def _sync_mesh(self):
+        """Push the working vertex buffer to the Open3D mesh."""
+        self._mesh.vertices = o3d.utility.Vector3dVector(self.vertices.astype(np.float64))
+        self._mesh_dirty = False
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -282,16 +858,19 @@ class DamascusLayer:
         Returns:
             Dictionary containing layer metrics
         """
-        vertices = np.asarray(self.mesh.vertices)
+        # Read straight from the vertex buffer; plain floats keep the stats JSON-safe
+        vertices = self.vertices
+        lower = vertices.min(axis=0).tolist()
+        upper = vertices.max(axis=0).tolist()
         
         return {
             'layer_index': self.layer_index,
-            'vertex_count': len(vertices),
-            'triangle_count': len(self.mesh.triangles),
-            'bounds_x': (vertices[:, 0].min(), vertices[:, 0].max()),
-            'bounds_y': (vertices[:, 1].min(), vertices[:, 1].max()),
-            'bounds_z': (vertices[:, 2].min(), vertices[:, 2].max()),
-            'center': vertices.mean(axis=0).tolist(),
+            'vertex_count': self.n_vertices,
+            'triangle_count': self.n_triangles,
+            'bounds_x': (lower[0], upper[0]),
+            'bounds_y': (lower[1], upper[1]),
+            'bounds_z': (lower[2], upper[2]),
+            'center': vertices.mean(axis=0, dtype=np.float64).tolist(),
             'color_type': 'WHITE' if self.color[0] > 0.5 else 'BLACK',
             'deformation_count': len(self.deformation_history)
         }
@@ -333,12 +912,103 @@ class Damascus3DBillet:
         self.length = length
         self.layers: List[DamascusLayer] = []
         
+        # Contiguous (N_layers, 8, 3) vertex tensor. Each layer's `vertices`
+        # is a view into this buffer, so billet-wide passes can walk every
+        # vertex as one array. `_vertex_storage` may hold spare capacity;
+        # `vertices` always covers exactly the current layers.
+        self._vertex_storage = np.empty((0, len(_BOX_VERTICES), 3), dtype=VERTEX_DTYPE)
+        self.vertices = self._vertex_storage
+        
+        # Running sum of layer thicknesses, see `total_height`
+        self._total_height = 0.0
+        
+        # Recent cross-section images, least recently used first
+        self._cross_section_cache = OrderedDict()
+        
         # Operation history for debugging and undo functionality
         self.operation_history: List[Dict[str, Any]] = []
         
         logger.info(f"Created new Damascus3DBillet: {width}mm x {length}mm")
         logger.debug(f"Billet initialized with width={width}, length={length}")
+    
+    def _reserve_layers(self, capacity: int):
+        """
+        Ensure the vertex tensor can hold at least `capacity` layers.
+        
+        When the buffer grows, existing vertex data is copied over and every
+        layer's `vertices` view is rebound to the new storage.
+        
+        Args:
+            capacity: Minimum number of layers the buffer must hold
+        """
+        if capacity <= len(self._vertex_storage):
+            return
+        
+        logger.debug("Growing vertex tensor: %d -> %d layers", len(self._vertex_storage), capacity)
+        
+        storage = np.empty((capacity,) + self._vertex_storage.shape[1:], dtype=self._vertex_storage.dtype)
+        layer_count = len(self.layers)
+        storage[:layer_count] = self._vertex_storage[:layer_count]
+        self._vertex_storage = storage
+        self.vertices = storage[:layer_count]
+        for i, layer in enumerate(self.layers):
+            layer.vertices = storage[i]
+        
+    def _layer_column(self, attribute: str) -> np.ndarray:
+        """
+        Gather a per-layer scalar attribute into an (N_layers, 1) column.
+        
+        The column broadcasts against (N_layers, 8) slices of the vertex
+        tensor, so billet-wide deformation passes can apply per-layer values
+        (position, thickness) without looping over layers.
+        
+        Args:
+            attribute: Name of the DamascusLayer attribute to gather
+        
+        Returns:
+            Array of shape (N_layers, 1) in the vertex tensor's dtype
+        """
+        return np.array([getattr(layer, attribute) for layer in self.layers],
+                        dtype=self.vertices.dtype).reshape(-1, 1)
+    
+    @property
+    def total_height(self) -> float:
+        """
+        Total stack height (sum of layer thicknesses) in mm.
+        
+        Maintained incrementally by add_layer and apply_compression. Code
+        that edits `layer.thickness` directly must call
+        refresh_total_height() afterwards.
+        """
+        return self._total_height
+    
+    def refresh_total_height(self) -> float:
+        """
+        Recompute the cached total height from the layer thicknesses.
+        
+        Returns:
+            The updated total height in mm
+        """
+        self._total_height = sum(layer.thickness for layer in self.layers)
+        return self._total_height
+    
+    def set_vertices(self, vertices: np.ndarray):
+        """
+        Replace the vertex positions of every layer in one write.
+        
+        Copies into the contiguous vertex tensor (each layer's `vertices`
+        view sees the change) and marks every layer's mesh as stale. Code
+        that also edits layer thickness must still call
+        refresh_total_height() afterwards.
         
+        Args:
+            vertices: (N_layers, 8, 3) array of new vertex positions
+        """
+        self.vertices[:] = vertices
+        for layer in self.layers:
+            layer._invalidate_mesh()
+        self.refresh_total_height()
+    
     def add_layer(self, thickness: float, is_white: bool):
         """
         Add a layer to the billet.
@@ -347,18 +1017,25 @@ class Damascus3DBillet:
             thickness: Thickness of layer in mm
             is_white: True for high-nickel (white) steel, False for high-carbon (black)
         """
-        # Calculate z position based on existing layers
-        z_pos = sum(layer.thickness for layer in self.layers)
+        # New layer sits on top of the existing stack
+        z_pos = self._total_height
         layer_index = len(self.layers)
         
         # White steel: light gray (0.9), Black steel: dark gray (0.2)
         color = (0.9, 0.9, 0.9) if is_white else (0.2, 0.2, 0.2)
         
-        logger.debug(f"Adding layer #{layer_index}: {'WHITE' if is_white else 'BLACK'}, "
-                    f"thickness={thickness}mm, z_pos={z_pos}mm")
+        logger.debug("Adding layer #%d: %s, thickness=%smm, z_pos=%smm",
+                     layer_index, 'WHITE' if is_white else 'BLACK', thickness, z_pos)
+        
+        # Grow geometrically so repeated add_layer calls stay amortized O(1)
+        if layer_index >= len(self._vertex_storage):
+            self._reserve_layers(max(2 * len(self._vertex_storage), layer_index + 1))
         
-        layer = DamascusLayer(z_pos, thickness, color, self.width, self.length, layer_index)
+        layer = DamascusLayer(z_pos, thickness, color, self.width, self.length, layer_index,
+                              vertices=self._vertex_storage[layer_index])
         self.layers.append(layer)
+        self.vertices = self._vertex_storage[:layer_index + 1]
+        self._total_height += thickness
         
     def create_simple_layers(self, num_layers: int = 20, white_thickness: float = 1.0, 
                            black_thickness: float = 1.0):
@@ -381,13 +1058,19 @@ class Damascus3DBillet:
         logger.info(f"Creating {num_layers} alternating layers...")
         logger.debug(f"Layer parameters: white={white_thickness}mm, black={black_thickness}mm")
         
+        # Pre-allocate the whole (num_layers, 8, 3) vertex tensor up front
         self.layers = []
+        self._vertex_storage = np.empty((num_layers, len(_BOX_VERTICES), 3), dtype=VERTEX_DTYPE)
+        self.vertices = self._vertex_storage[:0]
+        self._total_height = 0.0
         for i in range(num_layers):
             is_white = (i % 2 == 0)
             thickness = white_thickness if is_white else black_thickness
             self.add_layer(thickness, is_white)
         
-        total_height = sum(l.thickness for l in self.layers)
+        total_height = self.total_height
+        logger.info("Built %d layers (%d verts, %d tris)",
+                    num_layers, num_layers * len(_BOX_VERTICES), num_layers * len(_BOX_TRIANGLES))
         logger.info(f"Layer creation complete: {num_layers} layers, total height: {total_height:.1f}mm")
         logger.debug(f"White layers: {sum(1 for l in self.layers if l.color[0] > 0.5)}")
         logger.debug(f"Black layers: {sum(1 for l in self.layers if l.color[0] < 0.5)}")
@@ -398,6 +1081,21 @@ class Damascus3DBillet:
         """Get all layer meshes for visualization."""
         return [layer.get_mesh() for layer in self.layers]
     
+    def get_faces_and_colors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get every layer's triangles and their colors for polygon renderers.
+        
+        Gathered straight from the contiguous vertex tensor in one pass, in
+        layer order (12 triangles per layer), without touching Open3D.
+        
+        Returns:
+            (faces (T, 3, 3), facecolors (T, 3)) tuple
+        """
+        faces = self.vertices[:, _BOX_TRIANGLES].reshape(-1, 3, 3)
+        layer_colors = np.array([layer.color for layer in self.layers], dtype=float).reshape(-1, 3)
+        facecolors = np.repeat(layer_colors, len(_BOX_TRIANGLES), axis=0)
+        return faces, facecolors
+    
     def get_billet_stats(self) -> Dict[str, Any]:
         """
         Get comprehensive statistics about the entire billet.
@@ -412,16 +1110,17 @@ class Damascus3DBillet:
         stats = {
             'timestamp': datetime.now().isoformat(),
             'layer_count': len(self.layers),
-            'total_height_mm': sum(l.thickness for l in self.layers),
+            'total_height_mm': self.total_height,
             'width_mm': self.width,
             'length_mm': self.length,
-            'total_vertices': sum(len(l.mesh.vertices) for l in self.layers),
-            'total_triangles': sum(len(l.mesh.triangles) for l in self.layers),
+            'total_vertices': sum(l.n_vertices for l in self.layers),
+            'total_triangles': sum(l.n_triangles for l in self.layers),
             'operation_count': len(self.operation_history),
             'layers': [layer.get_stats() for layer in self.layers]
         }
         
-        logger.debug(f"Billet stats: {json.dumps(stats, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Billet stats: %s", json.dumps(stats, indent=2))
         return stats
     
     # ========================================================================
@@ -466,7 +1165,8 @@ class Damascus3DBillet:
         logger.info(f"Parameters: depth={wedge_depth}mm, angle={wedge_angle}°, gap={split_gap}mm")
         logger.info("="*70)
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        timestamp = datetime.now().isoformat()
         
         print(f"\nApplying wedge deformation:")
         print(f"  Depth: {wedge_depth}mm")
@@ -476,116 +1176,96 @@ class Damascus3DBillet:
         
         center_x = 0.0  # Wedge at center
         wedge_angle_rad = np.deg2rad(wedge_angle)
-        total_height = sum(l.thickness for l in self.layers)
+        tan_angle = np.tan(wedge_angle_rad)
+        sigma = self.width / 3.0  # Deformation zone width
+        total_height = self.total_height
         
         logger.debug(f"Wedge center X: {center_x}")
         logger.debug(f"Wedge angle (radians): {wedge_angle_rad:.4f}")
         logger.debug(f"Total billet height: {total_height:.2f}mm")
         
-        # Statistics tracking
-        total_vertices_processed = 0
-        displacement_stats = {
-            'max_vertical': 0.0,
-            'max_horizontal': 0.0,
-            'mean_vertical': [],
-            'mean_horizontal': []
-        }
+        # Process the whole billet in one pass over the (N_layers, 8, 3) vertex tensor
+        vertices = self.vertices
+        
+        # Layer's normalized position (0 = bottom, 1 = top)
+        layer_position_normalized = self._layer_column('z_position').ravel() / total_height
+        
+        # Per-vertex sample logging only when it will actually be emitted
+        log_samples = debug and logger.isEnabledFor(logging.DEBUG)
+        
+        # Keep the pre-deformation positions only for sample logging
+        original_vertices = vertices.copy() if log_samples else None
+        
+        # Vertical (Z, waterfall) and horizontal (X, split) displacement per vertex
+        downward_displacement = np.empty(vertices.shape[:2], dtype=vertices.dtype)
+        horizontal_displacement = np.empty(vertices.shape[:2], dtype=vertices.dtype)
+        _wedge_kernel(vertices, layer_position_normalized, center_x, sigma,
+                      wedge_depth, tan_angle, split_gap,
+                      downward_displacement, horizontal_displacement)
         
-        # Process each layer
+        # Per-layer displacement statistics: one array reduction per quantity,
+        # converted to Python floats in bulk
+        vertical_displacements = np.abs(downward_displacement)
+        horizontal_displacements = np.abs(horizontal_displacement)
+        vertical_max = vertical_displacements.max(axis=1).tolist()
+        vertical_mean = vertical_displacements.mean(axis=1).tolist()
+        horizontal_max = horizontal_displacements.max(axis=1).tolist()
+        horizontal_mean = horizontal_displacements.mean(axis=1).tolist()
+        
+        # Per-layer bookkeeping: mesh update, history, logging
         for layer_idx, layer in enumerate(self.layers):
-            logger.debug(f"Processing layer #{layer_idx}/{len(self.layers)}")
-            
-            vertices = np.asarray(layer.mesh.vertices).copy()
-            original_vertices = vertices.copy()
-            
-            # Layer's normalized position (0 = bottom, 1 = top)
-            layer_position_normalized = layer.z_position / total_height
-            
-            logger.debug(f"  Layer position (normalized): {layer_position_normalized:.3f}")
-            logger.debug(f"  Vertex count: {len(vertices)}")
+            logger.debug("Processing layer #%d/%d", layer_idx, len(self.layers))
+            logger.debug("  Layer position (normalized): %.3f", layer_position_normalized[layer_idx])
+            logger.debug("  Vertex count: %d", layer.n_vertices)
             
-            # Track displacements for this layer
-            vertical_displacements = []
-            horizontal_displacements = []
-            
-            # For each vertex, calculate deformation
-            for i, vertex in enumerate(vertices):
-                x, y, z = vertex
-                
-                # Distance from wedge centerline
-                dist_from_center = abs(x - center_x)
-                
-                # Which side of the wedge? (-1 = left, +1 = right)
-                side = np.sign(x - center_x) if abs(x - center_x) > 0.001 else 1.0
-                
-                # Deformation intensity: maximum at center, falls off with distance
-                # Using smooth Gaussian falloff for realistic material flow
-                sigma = self.width / 3.0  # Deformation zone width
-                intensity = np.exp(-(dist_from_center**2) / (2 * sigma**2))
-                
-                # DOWNWARD DISPLACEMENT (in -Z direction, since layers stack in Z)
-                # Layers are pulled down by wedge - creates waterfall
-                # Top layers displace more than bottom layers
-                downward_displacement = -wedge_depth * intensity * layer_position_normalized
-                
-                # HORIZONTAL DISPLACEMENT (in X direction)
-                # Wedge pushes layers outward - creates the split
-                # The wedge angle determines how much horizontal spread
-                # Two components: split gap + angle-induced spread
-                horizontal_displacement = side * split_gap * intensity * layer_position_normalized
-                horizontal_displacement += side * wedge_depth * np.tan(wedge_angle_rad) * intensity * layer_position_normalized
-                
-                # Apply the deformations
-                # NEW COORDINATE SYSTEM: X=width, Y=length, Z=height (layers stack in Z)
-                vertices[i, 0] += horizontal_displacement  # X axis (width) - split
-                vertices[i, 2] += downward_displacement    # Z axis (height) - waterfall
-                
-                # Track displacements for statistics
-                vertical_displacements.append(abs(downward_displacement))
-                horizontal_displacements.append(abs(horizontal_displacement))
-                
-                # Log sample vertices (every 10th vertex to avoid log spam)
-                if debug and i % 10 == 0:
-                    logger.debug(f"    Vertex {i}: ({x:.2f}, {y:.2f}, {z:.2f}) -> "
-                               f"({vertices[i,0]:.2f}, {vertices[i,1]:.2f}, {vertices[i,2]:.2f}) | "
-                               f"Δx={horizontal_displacement:.2f}, Δz={downward_displacement:.2f}")
-            
-            # Update the mesh with deformed vertices
-            layer.mesh.vertices = o3d.utility.Vector3dVector(vertices)
-            layer.mesh.compute_vertex_normals()
+            # Mesh is refreshed from the vertex buffer on next access
+            layer._invalidate_mesh()
             
             # Record deformation in layer history
             deformation_record = {
                 'operation': 'wedge',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'parameters': {
                     'wedge_depth': wedge_depth,
                     'wedge_angle': wedge_angle,
                     'split_gap': split_gap
                 },
                 'displacement_stats': {
-                    'vertical_max': max(vertical_displacements),
-                    'vertical_mean': np.mean(vertical_displacements),
-                    'horizontal_max': max(horizontal_displacements),
-                    'horizontal_mean': np.mean(horizontal_displacements)
+                    'vertical_max': vertical_max[layer_idx],
+                    'vertical_mean': vertical_mean[layer_idx],
+                    'horizontal_max': horizontal_max[layer_idx],
+                    'horizontal_mean': horizontal_mean[layer_idx]
                 }
             }
             layer.deformation_history.append(deformation_record)
             
-            # Update global statistics
-            displacement_stats['max_vertical'] = max(displacement_stats['max_vertical'], max(vertical_displacements))
-            displacement_stats['max_horizontal'] = max(displacement_stats['max_horizontal'], max(horizontal_displacements))
-            displacement_stats['mean_vertical'].append(np.mean(vertical_displacements))
-            displacement_stats['mean_horizontal'].append(np.mean(horizontal_displacements))
-            
-            total_vertices_processed += len(vertices)
-            
-            logger.debug(f"  Layer #{layer_idx} deformation complete:")
-            logger.debug(f"    Vertical: max={max(vertical_displacements):.2f}mm, mean={np.mean(vertical_displacements):.2f}mm")
-            logger.debug(f"    Horizontal: max={max(horizontal_displacements):.2f}mm, mean={np.mean(horizontal_displacements):.2f}mm")
+            logger.debug("  Layer #%d deformation complete:", layer_idx)
+            logger.debug("    Vertical: max=%.2fmm, mean=%.2fmm", vertical_max[layer_idx], vertical_mean[layer_idx])
+            logger.debug("    Horizontal: max=%.2fmm, mean=%.2fmm", horizontal_max[layer_idx], horizontal_mean[layer_idx])
+        
+        # Log sample vertices (every 10th vertex of each layer, capped)
+        if log_samples:
+            samples = [(layer_idx, i) for layer_idx in range(vertices.shape[0])
+                       for i in range(0, vertices.shape[1], 10)]
+            for layer_idx, i in samples[:MAX_VERTEX_LOG_SAMPLES]:
+                x, y, z = original_vertices[layer_idx, i]
+                x_new, y_new, z_new = vertices[layer_idx, i]
+                logger.debug(f"    Layer #{layer_idx} vertex {i}: ({x:.2f}, {y:.2f}, {z:.2f}) -> "
+                           f"({x_new:.2f}, {y_new:.2f}, {z_new:.2f}) | "
+                           f"Δx={horizontal_displacement[layer_idx, i]:.2f}, "
+                           f"Δz={downward_displacement[layer_idx, i]:.2f}")
+        
+        # Global statistics derive from the per-layer reductions
+        total_vertices_processed = vertices.shape[0] * vertices.shape[1]
+        displacement_stats = {
+            'max_vertical': max(vertical_max, default=0.0),
+            'max_horizontal': max(horizontal_max, default=0.0),
+            'mean_vertical': vertical_mean,
+            'mean_horizontal': horizontal_mean
+        }
         
         # Operation complete - log summary
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = time.perf_counter() - start_time
         
         logger.info(f"Wedge deformation complete in {elapsed:.2f}s")
         logger.info(f"  Processed {total_vertices_processed} vertices across {len(self.layers)} layers")
@@ -595,7 +1275,7 @@ class Damascus3DBillet:
         # Record in billet history
         self.operation_history.append({
             'operation': 'wedge_deformation',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'duration_seconds': elapsed,
             'parameters': {
                 'wedge_depth': wedge_depth,
@@ -642,72 +1322,62 @@ class Damascus3DBillet:
         logger.info(f"Parameters: angle={angle_degrees}°, axis={axis}")
         logger.info("="*70)
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        timestamp = datetime.now().isoformat()
         
         print(f"\nApplying twist deformation: {angle_degrees}° around {axis}-axis")
         
         angle_rad = np.deg2rad(angle_degrees)
         logger.debug(f"Twist angle (radians): {angle_rad:.4f}")
         
-        total_vertices_processed = 0
+        # Only a non-zero Y-axis twist moves vertices (rotation in the XZ
+        # plane); anything else leaves the geometry, and so the layers'
+        # geometry stamps and every cache keyed on them, untouched
+        rotate_xz = (axis == 'y') and angle_rad != 0.0
+        
+        # Twist the whole billet in one vectorized pass over the
+        # (N_layers, 8, 3) vertex tensor
+        vertices = self.vertices
+        
+        # Y is untouched by the twist, so it can be sampled for logging afterwards
+        if rotate_xz:
+            # Rotate in XZ plane around Y-axis (length axis), about each
+            # layer's own mid-plane
+            z_center = (self._layer_column('z_position') + self._layer_column('thickness') / 2).ravel()
+            _twist_kernel(vertices, angle_rad, self.length, z_center)
+        
+        # Log first vertex of each layer (capped)
+        if debug and logger.isEnabledFor(logging.DEBUG):
+            for layer_idx in range(min(vertices.shape[0], MAX_VERTEX_LOG_SAMPLES)):
+                y = vertices[layer_idx, 0, 1]
+                normalized_position = (y + self.length/2) / self.length  # 0 to 1
+                logger.debug(f"  Layer #{layer_idx} Y position: {y:.2f}mm, normalized: {normalized_position:.3f}, "
+                           f"rotation: {np.rad2deg(angle_rad * normalized_position):.2f}°")
         
+        # Per-layer bookkeeping: mesh update, history
         for layer_idx, layer in enumerate(self.layers):
-            logger.debug(f"Twisting layer #{layer_idx}")
+            logger.debug("Twisting layer #%d", layer_idx)
             
-            vertices = np.asarray(layer.mesh.vertices).copy()
-            
-            for i, vertex in enumerate(vertices):
-                x, y, z = vertex
-                
-                # Twist varies linearly along the length (Y-axis)
-                # y = -length/2 => no twist (0°)
-                # y = +length/2 => full twist (angle_degrees)
-                normalized_position = (y + self.length/2) / self.length  # 0 to 1
-                current_angle = angle_rad * normalized_position
-                
-                if debug and i == 0:  # Log first vertex of each layer
-                    logger.debug(f"  Y position: {y:.2f}mm, normalized: {normalized_position:.3f}, "
-                               f"rotation: {np.rad2deg(current_angle):.2f}°")
-                
-                # Rotate around Y-axis (length axis)
-                # This rotates in the XZ plane
-                if axis == 'y':
-                    # Rotate in XZ plane around Y-axis
-                    x_center = 0
-                    z_center = layer.z_position + layer.thickness/2
-                    
-                    # Translate to origin
-                    x_rel = x - x_center
-                    z_rel = z - z_center
-                    
-                    # Apply rotation matrix
-                    x_new = x_rel * np.cos(current_angle) - z_rel * np.sin(current_angle)
-                    z_new = x_rel * np.sin(current_angle) + z_rel * np.cos(current_angle)
-                    
-                    # Translate back
-                    vertices[i, 0] = x_new + x_center
-                    vertices[i, 2] = z_new + z_center
-            
-            # Update the mesh
-            layer.mesh.vertices = o3d.utility.Vector3dVector(vertices)
-            layer.mesh.compute_vertex_normals()
+            # Mesh is refreshed from the vertex buffer on next access
+            if rotate_xz:
+                layer._invalidate_mesh()
             
             # Record in layer history
             layer.deformation_history.append({
                 'operation': 'twist',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'parameters': {'angle_degrees': angle_degrees, 'axis': axis}
             })
-            
-            total_vertices_processed += len(vertices)
         
-        elapsed = (datetime.now() - start_time).total_seconds()
+        total_vertices_processed = vertices.shape[0] * vertices.shape[1]
+        
+        elapsed = time.perf_counter() - start_time
         logger.info(f"Twist complete in {elapsed:.2f}s - processed {total_vertices_processed} vertices")
         
         # Record in billet history
         self.operation_history.append({
             'operation': 'twist',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'duration_seconds': elapsed,
             'parameters': {'angle_degrees': angle_degrees, 'axis': axis}
         })
@@ -731,9 +1401,9 @@ class Damascus3DBillet:
           4. After drilling or twisting, compression closes voids
         
         Mathematical model:
-          - All Y coordinates scaled by compression_factor
+          - All Z coordinates (height) scaled by compression_factor
           - Layer thicknesses scaled proportionally
-          - Preserves X and Z dimensions
+          - Preserves X and Y dimensions
         
         Args:
             compression_factor: Multiply height by this factor (< 1.0 compresses)
@@ -744,9 +1414,10 @@ class Damascus3DBillet:
         logger.info(f"Parameters: factor={compression_factor} ({compression_factor*100:.1f}%)")
         logger.info("="*70)
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        timestamp = datetime.now().isoformat()
         
-        total_height_before = sum(l.thickness for l in self.layers)
+        total_height_before = self.total_height
         total_height_after = total_height_before * compression_factor
         
         print(f"\nApplying compression: {compression_factor:.1%} of original height")
@@ -754,52 +1425,52 @@ class Damascus3DBillet:
         logger.debug(f"Height after: {total_height_after:.2f}mm")
         logger.debug(f"Reduction: {total_height_before - total_height_after:.2f}mm")
         
+        # Compress the whole billet in one pass over the vertex tensor
+        vertices = self.vertices
+        
+        original_z_min = vertices[:, :, 2].min(axis=1, initial=np.inf)
+        original_z_max = vertices[:, :, 2].max(axis=1, initial=-np.inf)
+        
+        # Compress in Z direction (height): scale Z positions proportionally
+        vertices[:, :, 2] *= compression_factor
+        
+        new_z_min = vertices[:, :, 2].min(axis=1, initial=np.inf)
+        new_z_max = vertices[:, :, 2].max(axis=1, initial=-np.inf)
+        
         for layer_idx, layer in enumerate(self.layers):
-            logger.debug(f"Compressing layer #{layer_idx}")
-            
-            vertices = np.asarray(layer.mesh.vertices).copy()
-            
-            original_y_min = vertices[:, 2].min()
-            original_y_max = vertices[:, 2].max()
-            
-            # Compress in Z direction (height)
-            for i, vertex in enumerate(vertices):
-                x, y, z = vertex
-                # Scale Z position proportionally
-                vertices[i, 2] = z * scale_factor
+            logger.debug("Compressing layer #%d", layer_idx)
             
             # Update layer properties
             layer.thickness *= compression_factor
             layer.z_position *= compression_factor
             
-            new_y_min = vertices[:, 2].min()
-            new_y_max = vertices[:, 2].max()
-            
-            logger.debug(f"  Layer #{layer_idx} Z bounds: [{original_y_min:.2f}, {original_y_max:.2f}] -> "
-                        f"[{new_y_min:.2f}, {new_y_max:.2f}]")
+            logger.debug("  Layer #%d Z bounds: [%.2f, %.2f] -> [%.2f, %.2f]", layer_idx,
+                         original_z_min[layer_idx], original_z_max[layer_idx],
+                         new_z_min[layer_idx], new_z_max[layer_idx])
             
-            # Update mesh
-            layer.mesh.vertices = o3d.utility.Vector3dVector(vertices)
-            layer.mesh.compute_vertex_normals()
+            # Mesh is refreshed from the vertex buffer on next access
+            layer._invalidate_mesh()
             
             # Record in history
             layer.deformation_history.append({
                 'operation': 'compression',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'parameters': {'compression_factor': compression_factor},
                 'height_change': {
-                    'before': original_y_max - original_y_min,
-                    'after': new_y_max - new_y_min
+                    'before': float(original_z_max[layer_idx] - original_z_min[layer_idx]),
+                    'after': float(new_z_max[layer_idx] - new_z_min[layer_idx])
                 }
             })
         
-        elapsed = (datetime.now() - start_time).total_seconds()
+        self._total_height = total_height_after
+        
+        elapsed = time.perf_counter() - start_time
         logger.info(f"Compression complete in {elapsed:.2f}s")
         logger.info(f"  Height: {total_height_before:.1f}mm → {total_height_after:.1f}mm")
         
         self.operation_history.append({
             'operation': 'compression',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'duration_seconds': elapsed,
             'parameters': {'compression_factor': compression_factor},
             'height_change': {
@@ -845,72 +1516,58 @@ class Damascus3DBillet:
         logger.info(f"Parameters: position=({x_pos:.1f}, {z_pos:.1f}), radius={radius}mm")
         logger.info("="*70)
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        timestamp = datetime.now().isoformat()
         
         print(f"\nDrilling hole at ({x_pos:.1f}, {z_pos:.1f}) with radius {radius:.1f}mm")
         
-        total_vertices_affected = 0
+        # Drill through the whole billet in one vectorized pass over the
+        # (N_layers, 8, 3) vertex tensor
+        vertices = self.vertices
+        
+        # Hole axis runs along Z, so distances are measured in the XY plane
+        dist = np.empty((1,) + vertices.shape[:2], dtype=vertices.dtype)
+        _drill_kernel(vertices, np.array([[x_pos, z_pos]], dtype=np.float64), radius, dist)
+        dist = dist[0]
+        
+        # Only vertices within the influence radius were moved
+        affected = dist < radius * 2.0
+        inside = dist < radius
+        vertices_affected = affected.sum(axis=1)
+        
+        total_vertices_affected = int(vertices_affected.sum())
+        
+        # Log vertices inside the hole (capped)
+        if debug and logger.isEnabledFor(logging.DEBUG):
+            for layer_idx, i in np.argwhere(inside)[:MAX_VERTEX_LOG_SAMPLES]:
+                logger.debug(f"  Layer #{layer_idx} vertex {i} INSIDE hole: "
+                           f"dist={dist[layer_idx, i]:.2f}mm, push=1.5")
         
         for layer_idx, layer in enumerate(self.layers):
-            logger.debug(f"Drilling through layer #{layer_idx}")
+            logger.debug("Drilling through layer #%d", layer_idx)
             
-            vertices = np.asarray(layer.mesh.vertices).copy()
-            vertices_affected_in_layer = 0
+            vertices_affected_in_layer = int(vertices_affected[layer_idx])
             
-            for i, vertex in enumerate(vertices):
-                x, y, z = vertex
-                
-                # Distance from hole center (in XY plane - horizontal)
-                dx = x - x_pos
-                dy = y - z_pos
-                dist = np.sqrt(dx**2 + dy**2)
-                
-                # Only affect vertices within influence radius
-                if dist < radius * 2.0:
-                    vertices_affected_in_layer += 1
-                    
-                    if dist < radius:
-                        # Inside the hole - push outward strongly
-                        push_factor = 1.5
-                        logger.debug(f"  Vertex {i} INSIDE hole: dist={dist:.2f}mm, push={push_factor}")
-                    else:
-                        # Outside but close - gentle push with smooth falloff
-                        influence = np.exp(-((dist - radius)**2) / (2 * radius**2))
-                        push_factor = influence * 0.3
-                    
-                    # Push radially outward in XY plane (horizontal)
-                    if dist > 0.001:  # Avoid division by zero at exact center
-                        direction_x = dx / dist
-                        direction_y = dy / dist
-                        
-                        displacement_x = direction_x * radius * push_factor
-                        displacement_y = direction_y * radius * push_factor
-                        
-                        vertices[i, 0] += displacement_x
-                        vertices[i, 1] += displacement_y
+            logger.debug("  Layer #%d: %d vertices affected", layer_idx, vertices_affected_in_layer)
             
-            logger.debug(f"  Layer #{layer_idx}: {vertices_affected_in_layer} vertices affected")
-            total_vertices_affected += vertices_affected_in_layer
-            
-            # Update mesh
-            layer.mesh.vertices = o3d.utility.Vector3dVector(vertices)
-            layer.mesh.compute_vertex_normals()
+            # Mesh is refreshed from the vertex buffer on next access
+            layer._invalidate_mesh()
             
             # Record in history
             layer.deformation_history.append({
                 'operation': 'drill',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'parameters': {'x_pos': x_pos, 'z_pos': z_pos, 'radius': radius},
                 'vertices_affected': vertices_affected_in_layer
             })
         
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = time.perf_counter() - start_time
         logger.info(f"Drilling complete in {elapsed:.2f}s")
         logger.info(f"  Total vertices affected: {total_vertices_affected}")
         
         self.operation_history.append({
             'operation': 'drill_hole',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'duration_seconds': elapsed,
             'parameters': {'x_pos': x_pos, 'z_pos': z_pos, 'radius': radius},
             'vertices_affected': total_vertices_affected
@@ -918,6 +1575,85 @@ class Damascus3DBillet:
         
         print("Drilling complete!")
     
+    def drill_holes(self, positions, radius: float = 10.0, debug: bool = True):
+        """
+        Drill a set of holes through the billet in one pass.
+        
+        Equivalent to calling drill_hole() once per position, in order, but
+        the vertex tensor is walked once (as used for raindrop grids). The
+        history gets the same per-hole entries drill_hole() would write, so
+        saved operation logs don't depend on which of the two was used.
+        
+        Args:
+            positions: Sequence of (x_pos, z_pos) hole centres (mm)
+            radius: Radius of every hole (mm)
+            debug: Enable detailed debug logging
+        """
+        positions = [(float(x_pos), float(z_pos)) for x_pos, z_pos in positions]
+        
+        logger.info("="*70)
+        logger.info("DRILLING OPERATION")
+        logger.info("Parameters: %d holes, radius=%smm", len(positions), radius)
+        logger.info("="*70)
+        
+        start_time = time.perf_counter()
+        timestamp = datetime.now().isoformat()
+        
+        print(f"\nDrilling {len(positions)} holes with radius {radius:.1f}mm")
+        
+        vertices = self.vertices
+        
+        # One distance plane per hole, each measured after the holes before it
+        holes = np.array(positions, dtype=np.float64).reshape(-1, 2)
+        dist = np.empty((len(holes),) + vertices.shape[:2], dtype=vertices.dtype)
+        _drill_kernel(vertices, holes, radius, dist)
+        
+        # Only vertices within the influence radius of a hole were moved;
+        # counts per (hole, layer)
+        vertices_affected = (dist < radius * 2.0).sum(axis=2)
+        
+        total_vertices_affected = int(vertices_affected.sum())
+        
+        # Log vertices inside a hole (capped)
+        if debug and logger.isEnabledFor(logging.DEBUG):
+            inside = dist < radius
+            for hole_idx, layer_idx, i in np.argwhere(inside)[:MAX_VERTEX_LOG_SAMPLES]:
+                logger.debug("  Layer #%d vertex %d INSIDE hole %d: dist=%.2fmm, push=1.5",
+                             layer_idx, i, hole_idx, dist[hole_idx, layer_idx, i])
+        
+        per_layer = vertices_affected.T.tolist()
+        for layer_idx, layer in enumerate(self.layers):
+            logger.debug("  Layer #%d: %d vertices affected", layer_idx, sum(per_layer[layer_idx]))
+            
+            # Mesh is refreshed from the vertex buffer on next access
+            layer._invalidate_mesh()
+            
+            # Record in history, one entry per hole
+            for (x_pos, z_pos), vertices_affected_in_layer in zip(positions, per_layer[layer_idx]):
+                layer.deformation_history.append({
+                    'operation': 'drill',
+                    'timestamp': timestamp,
+                    'parameters': {'x_pos': x_pos, 'z_pos': z_pos, 'radius': radius},
+                    'vertices_affected': vertices_affected_in_layer
+                })
+        
+        elapsed = time.perf_counter() - start_time
+        logger.info("Drilling complete in %.2fs", elapsed)
+        logger.info("  Total vertices affected: %d", total_vertices_affected)
+        
+        # The pass is timed as a whole; each hole gets an equal share
+        per_hole = vertices_affected.sum(axis=1).tolist()
+        for (x_pos, z_pos), hole_vertices_affected in zip(positions, per_hole):
+            self.operation_history.append({
+                'operation': 'drill_hole',
+                'timestamp': timestamp,
+                'duration_seconds': elapsed / len(positions),
+                'parameters': {'x_pos': x_pos, 'z_pos': z_pos, 'radius': radius},
+                'vertices_affected': hole_vertices_affected
+            })
+        
+        print("Drilling complete!")
+    
     # ========================================================================
     # CROSS-SECTION EXTRACTION
     # ========================================================================
@@ -934,9 +1670,9 @@ class Damascus3DBillet:
         ---------
         1. Create empty image (white background)
         2. For each layer:
-           a. Check each triangle for intersection with Z=z_slice plane
-           b. If intersects, rasterize the triangle's contribution
-           c. Apply layer color to pixels
+           a. Check each triangle for intersection with the slice plane
+           b. If intersects, cut the triangle into a line segment
+           c. Draw the segment in the layer color
         3. Return final composed image
         
         DEBUGGING:
@@ -946,85 +1682,130 @@ class Damascus3DBillet:
         Args:
             z_slice: Z position to slice at (mm)
             resolution: Resolution of output image (pixels per side)
-            debug: Enable detailed debug logging
+            debug: Enable detailed debug logging and console progress
         
         Returns:
             2D numpy array representing the pattern (0-255 grayscale)
         """
         logger.info("="*70)
         logger.info("CROSS-SECTION EXTRACTION")
-        logger.info(f"Parameters: z_slice={z_slice}mm, resolution={resolution}px")
+        logger.info("Parameters: z_slice=%smm, resolution=%spx", z_slice, resolution)
         logger.info("="*70)
         
-        start_time = datetime.now()
-        
-        print(f"\nExtracting cross-section at Z = {z_slice:.1f}mm (resolution: {resolution}px)")
-        
-        # Create output image (white background)
-        img = np.ones((resolution, resolution)) * 255
-        logger.debug(f"Created {resolution}x{resolution} image canvas")
+        start_time = time.perf_counter()
+        
+        # Console progress is for scripted runs; interactive previews pass
+        # debug=False and re-slice on every slider move
+        if debug:
+            print(f"\nExtracting cross-section at Z = {z_slice:.1f}mm (resolution: {resolution}px)")
+        
+        # The same slice of unchanged geometry is served from the cache; layer
+        # stamps change on every deformation, so stale images never match
+        cache_key = (tuple(layer.geometry_stamp for layer in self.layers),
+                     self.width, self.total_height, z_slice, resolution)
+        cached = self._cross_section_cache.get(cache_key)
+        if cached is not None:
+            self._cross_section_cache.move_to_end(cache_key)
+            logger.info("Cross-section served from cache")
+            if debug:
+                print("Cross-section extracted (cached)!")
+            return cached.copy()
+        
+        # Create output image (white background), grayscale uint8 throughout
+        img = np.full((resolution, resolution), 255, dtype=np.uint8)
+        logger.debug("Created %dx%d image canvas", resolution, resolution)
         
         # Map from world coordinates to image pixels
         # For horizontal orientation: X=width, Z=height (layer stack)
         x_min, x_max = -self.width/2, self.width/2
         z_min = 0
-        z_max = sum(l.thickness for l in self.layers)
+        z_max = self.total_height
         
-        logger.debug(f"World bounds: X=[{x_min:.1f}, {x_max:.1f}], Z=[{z_min:.1f}, {z_max:.1f}]")
+        logger.debug("World bounds: X=[%.1f, %.1f], Z=[%.1f, %.1f]", x_min, x_max, z_min, z_max)
+
+        # Nothing to slice (no layers yet, or a zero-size billet): blank canvas
+        if not self.layers or x_max <= x_min or z_max <= z_min:
+            logger.warning("Billet has no extent to slice; returning blank cross-section")
+            if debug:
+                print("Cross-section extracted (empty billet)!")
+            return img
+
+        # Per-layer detail only when asked for and the logger would emit it
+        log_layers = debug and logger.isEnabledFor(logging.DEBUG)
         
         triangles_processed = 0
         triangles_intersecting = 0
-        pixels_colored = 0
+        
+        # Hit triangles from every layer, drawn together after the layer pass;
+        # one gray value and hit count per layer, expanded per triangle later
+        all_faces = []
+        layer_grays = []
+        layer_hit_counts = []
+        
+        # World -> pixel scale factors, computed once per slice
+        x_scale = resolution / (x_max - x_min)
+        z_scale = resolution / (z_max - z_min)
         
         # For each layer, determine if it intersects this Z slice
         for layer_idx, layer in enumerate(self.layers):
-            vertices = np.asarray(layer.mesh.vertices)
-            triangles = np.asarray(layer.mesh.triangles)
+            # Skip layers whose Y extent doesn't reach the slice plane
+            y_min, y_max = layer._get_y_bounds()
+            if not (y_min <= z_slice <= y_max):
+                continue
             
-            layer_intersections = 0
+            # All triangles at once: (T, 3 corners, xyz)
+            tri_verts = layer._get_faces()
+            triangles_processed += len(tri_verts)
             
-            # Check each triangle to see if it intersects the slice plane
-            for tri_idx, tri_indices in enumerate(triangles):
-                triangles_processed += 1
-                tri_verts = vertices[tri_indices]
-                
-                # Check if triangle intersects the Y = z_slice plane (slicing along length)
-                y_coords = tri_verts[:, 1]
-                
-                # Triangle intersects if z_slice is between min and max y
-                if y_coords.min() <= z_slice <= y_coords.max():
-                    triangles_intersecting += 1
-                    layer_intersections += 1
-                    
-                    # Get coordinates for this triangle
-                    z_coords = tri_verts[:, 2]  # Height (layer stack)
-                    x_coords = tri_verts[:, 0]  # Width
-                    
-                    # Convert to pixel coordinates and rasterize
-                    for x_val in x_coords:
-                        for z_val in z_coords:
-                            # Map to pixel space
-                            px = int((x_val - x_min) / (x_max - x_min) * resolution)
-                            pz = int((z_val - z_min) / (z_max - z_min) * resolution)
-                            
-                            if 0 <= px < resolution and 0 <= pz < resolution:
-                                # Apply layer color (white=255, black=50)
-                                color_val = 255 if layer.color[0] > 0.5 else 50
-                                img[resolution - 1 - pz, px] = color_val  # Flip Z for display
-                                pixels_colored += 1
+            # Triangle intersects the Y = z_slice plane (slicing along length)
+            # if z_slice is between its min and max y, i.e. its signed distances
+            # to the plane don't all share one sign (zero = touching)
+            signed_dist = tri_verts[:, :, 1] - z_slice
+            hits = signed_dist.min(axis=1) * signed_dist.max(axis=1) <= 0
+            candidate = tri_verts[hits]
             
-            if debug and layer_intersections > 0:
-                logger.debug(f"Layer #{layer_idx} ({layer.get_stats()['color_type']}): "
-                           f"{layer_intersections} triangles intersect slice plane")
-        
-        elapsed = (datetime.now() - start_time).total_seconds()
-        logger.info(f"Cross-section extraction complete in {elapsed:.2f}s")
-        logger.info(f"  Triangles processed: {triangles_processed}")
-        logger.info(f"  Triangles intersecting: {triangles_intersecting}")
-        logger.info(f"  Pixels colored: {pixels_colored}")
+            layer_intersections = len(candidate)
+            triangles_intersecting += layer_intersections
+            if layer_intersections == 0:
+                continue
+            
+            # Apply layer color (white=255, black=50), decided once per layer
+            is_white = layer.color[0] > 0.5
+            all_faces.append(candidate)
+            layer_grays.append(255 if is_white else 50)
+            layer_hit_counts.append(layer_intersections)
+            
+            if log_layers:
+                logger.debug("Layer #%d (%s): %d triangles intersect slice plane", layer_idx,
+                             'WHITE' if is_white else 'BLACK', layer_intersections)
         
-        print("Cross-section extracted!")
-        return img.astype(np.uint8)
+        # Cut and rasterize all layers in one pass, each triangle becoming a
+        # segment in the XZ plane; stacking order is kept, so upper layers
+        # still paint over lower ones where they overlap
+        pixels_colored = 0
+        if all_faces:
+            # Geometry stays in the vertex buffer's float32; pixel positions
+            # are quantized to `resolution`, far coarser than float32 precision
+            as_vertex = self.vertices.dtype.type
+            colors = np.repeat(np.array(layer_grays, dtype=np.uint8), layer_hit_counts)
+            pixels_colored = _rasterize_slice(np.concatenate(all_faces), colors,
+                                              as_vertex(z_slice), as_vertex(x_min), as_vertex(x_scale),
+                                              as_vertex(z_min), as_vertex(z_scale), img)
+        
+        elapsed = time.perf_counter() - start_time
+        logger.info("Cross-section extraction complete in %.2fs", elapsed)
+        logger.info("  Triangles processed: %d", triangles_processed)
+        logger.info("  Triangles intersecting: %d", triangles_intersecting)
+        logger.info("  Pixels colored: %d", pixels_colored)
+        
+        # Callers get their own copy, so the cached image can't be modified
+        self._cross_section_cache[cache_key] = img
+        if len(self._cross_section_cache) > CROSS_SECTION_CACHE_SIZE:
+            self._cross_section_cache.popitem(last=False)
+        
+        if debug:
+            print("Cross-section extracted!")
+        return img.copy()
     
     # ========================================================================
     # VISUALIZATION
@@ -1078,7 +1859,7 @@ class Damascus3DBillet:
         IMPLEMENTATION DETAILS:
         ----------------------
         - Creates 3D axis with equal aspect ratio
-        - Renders each layer as Poly3DCollection
+        - Renders all layers as a single Poly3DCollection
         - Adds coordinate labels and grid
         - Interactive rotation and zoom
         """
@@ -1096,20 +1877,23 @@ class Damascus3DBillet:
         
         logger.debug(f"Rendering {len(self.layers)} layers...")
         
-        # Draw each layer
+        # Gather faces from every layer
+        layer_faces = []
         for layer_idx, layer in enumerate(self.layers):
-            vertices = np.asarray(layer.mesh.vertices)
-            triangles = np.asarray(layer.mesh.triangles)
+            vertices, triangles = layer._get_np_geometry()
             
-            logger.debug(f"  Rendering layer #{layer_idx}: {len(triangles)} triangles")
+            logger.debug("  Rendering layer #%d: %d triangles", layer_idx, len(triangles))
             
             # Create faces from triangles
-            faces = vertices[triangles]
-            
-            # Create 3D polygon collection
+            layer_faces.append(vertices[triangles])
+        
+        # One collection for the whole billet: matplotlib pays its per-collection
+        # sorting and compositing cost once, not once per layer
+        if layer_faces:
+            tri_counts = [len(faces) for faces in layer_faces]
             poly_collection = Poly3DCollection(
-                faces,
-                facecolors=layer.color,
+                np.concatenate(layer_faces),
+                facecolors=np.repeat([layer.color for layer in self.layers], tri_counts, axis=0),
                 edgecolors='black',
                 linewidths=0.1,
                 alpha=0.95
@@ -1123,9 +1907,9 @@ class Damascus3DBillet:
         ax.set_zlabel('Z (height) [mm]', fontsize=10)
         
         # Set equal aspect ratio and limits
-        max_range = max(self.width, sum(l.thickness for l in self.layers), self.length)
+        max_range = max(self.width, self.total_height, self.length)
         mid_x = 0
-        mid_y = sum(l.thickness for l in self.layers) / 2
+        mid_y = self.total_height / 2
         mid_z = 0
         
         logger.debug(f"View bounds: max_range={max_range:.1f}mm, center=({mid_x}, {mid_y:.1f}, {mid_z})")
@@ -1166,9 +1950,8 @@ class Damascus3DBillet:
         # Extract cross-section
         img_array = self.extract_cross_section(z_slice, resolution, debug=False)
         
-        # Save using PIL
-        img = Image.fromarray(img_array)
-        img.save(output_path)
+        # Save (OpenCV for PNG when available, PIL otherwise)
+        _write_grayscale_image(img_array, output_path)
         
         logger.info(f"Cross-section saved to: {output_path}")
         print(f"Saved cross-section to: {output_path}")
@@ -1192,11 +1975,22 @@ class Damascus3DBillet:
         logger.debug(f"  Merge layers: {merge_layers}")
         
         if merge_layers:
-            # Combine all layers into single mesh
+            # Combine all layers into single mesh, built in one go from the
+            # contiguous vertex tensor: every layer shares the box topology, so
+            # the merged triangles are the box table offset per layer
             logger.debug("Merging all layers into single mesh...")
-            combined_mesh = o3d.geometry.TriangleMesh()
-            for layer in self.layers:
-                combined_mesh += layer.mesh
+            n_box_vertices = len(_BOX_VERTICES)
+            offsets = np.arange(len(self.layers), dtype=_BOX_TRIANGLES.dtype) * n_box_vertices
+            triangles = (_BOX_TRIANGLES[np.newaxis] + offsets[:, np.newaxis, np.newaxis]).reshape(-1, 3)
+            vertex_colors = np.repeat(np.array([layer.color for layer in self.layers], dtype=np.float64).reshape(-1, 3),
+                                      n_box_vertices, axis=0)
+            
+            combined_mesh = o3d.geometry.TriangleMesh(
+                o3d.utility.Vector3dVector(self.vertices.reshape(-1, 3).astype(np.float64)),
+                o3d.utility.Vector3iVector(triangles)
+            )
+            combined_mesh.vertex_colors = o3d.utility.Vector3dVector(vertex_colors)
+            combined_mesh.compute_vertex_normals()
             
             logger.debug(f"  Combined mesh: {len(combined_mesh.vertices)} vertices, "
                         f"{len(combined_mesh.triangles)} triangles")
@@ -1209,8 +2003,8 @@ class Damascus3DBillet:
             
             for layer_idx, layer in enumerate(self.layers):
                 layer_path = f"{base_path}_layer{layer_idx:03d}.{extension}"
-                logger.debug(f"  Exporting layer #{layer_idx} to {layer_path}")
-                success = o3d.io.write_triangle_mesh(layer_path, layer.mesh)
+                logger.debug("  Exporting layer #%d to %s", layer_idx, layer_path)
+                success = o3d.io.write_triangle_mesh(layer_path, layer.get_mesh())
         
         if success:
             logger.info(f"3D model export successful: {output_path}")
@@ -1242,14 +2036,14 @@ class Damascus3DBillet:
                 'width_mm': self.width,
                 'length_mm': self.length,
                 'layer_count': len(self.layers),
-                'total_height_mm': sum(l.thickness for l in self.layers)
+                'total_height_mm': self.total_height
             },
             'operations': self.operation_history,
             'final_stats': self.get_billet_stats()
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps_indented(log_data))
         
         logger.info(f"Operation log saved: {len(self.operation_history)} operations recorded")
         print(f"Operation log saved to: {output_path}")
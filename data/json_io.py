@@ -0,0 +1,39 @@
+"""
+JSON helpers shared by the simulator and the steel database.
+
+orjson is used when it is installed (faster), the stdlib json module
+otherwise. Both backends accept the same inputs: NumPy arrays and scalars
+are written as plain lists and numbers, and non-string keys are converted
+to strings.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_builtin(obj):
+    """`default` hook for both backends: NumPy arrays/scalars -> lists/numbers."""
+    tolist = getattr(obj, 'tolist', None)
+    if callable(tolist):
+        return tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps_indented(obj) -> bytes:
+        """Serialize obj as UTF-8 JSON with 2-space indentation."""
+        return orjson.dumps(obj, default=_to_builtin,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_SERIALIZE_NUMPY)
+else:
+    loads = json.loads
+
+    def dumps_indented(obj) -> bytes:
+        """Serialize obj as UTF-8 JSON with 2-space indentation."""
+        return json.dumps(obj, indent=2, default=_to_builtin).encode('utf-8')
@@ -7,21 +7,234 @@ and material loss data for various steels used in Damascus pattern welding.
 Supports both built-in steels and user-defined custom steels.
 """
 
-import json
+import os
+import sys
+import threading
+import weakref
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from data.json_io import dumps_indented as _dumps_indented, loads as _loads
+
 
 MODULE_DIR = Path(__file__).resolve().parent
 DEFAULT_CUSTOM_STEELS_PATH = MODULE_DIR / "custom_steels.json"
 
 
+def _intern(value):
+    """sys.intern() strings, pass anything else (e.g. a JSON null) through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Fields that get_display_text()/export_steel_for_github() format as numbers
+_NUMBER_FIELDS = ('density', 'thermal_expansion', 'thermal_conductivity')
+_RANGE_FIELDS = ('austenitizing_temp', 'forging_range', 'scale_loss', 'decarb_depth')
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_pair(value) -> bool:
+    return isinstance(value, (list, tuple)) and len(value) == 2
+
+
+def _steel_data_problem(data) -> Optional[str]:
+    """
+    Check one custom steel entry loaded from JSON.
+    
+    Only fields that are present are checked (Steel supplies defaults for
+    the rest), and only for the shapes the display code relies on.
+    
+    Returns:
+        A description of the first problem found, or None if the entry is usable
+    """
+    if not isinstance(data, dict):
+        return "entry is not an object"
+    for field in _NUMBER_FIELDS:
+        if field in data and not _is_number(data[field]):
+            return f"{field} is not a number"
+    for field in _RANGE_FIELDS:
+        if field in data and not (_is_pair(data[field]) and all(map(_is_number, data[field]))):
+            return f"{field} is not a (min, max) pair"
+    tempering_data = data.get('tempering_data', [])
+    if not (isinstance(tempering_data, list) and all(map(_is_pair, tempering_data))):
+        return "tempering_data is not a list of (temp, hardness) pairs"
+    for field in ('name', 'category', 'quench_method', 'etch_color', 'notes'):
+        if field in data and not isinstance(data[field], str):
+            return f"{field} is not a string"
+    return None
+
+
+# Built-in steel definitions, keyed like SteelDatabase.steels. Steel objects
+# share the nested lists/tuples, so treat this table as read-only.
+_BUILTIN_STEEL_DATA = {
+    '1084': {
+        'name': '1084 High Carbon Steel',
+        'category': 'High Carbon',
+        'density': 0.284,
+        'thermal_expansion': 7.2e-6,
+        'thermal_conductivity': 28.0,
+        'modulus_elasticity': 30,
+        'austenitizing_temp': (1500, 1500),
+        'quench_method': 'Oil (Parks 50 or preheated Canola)',
+        'tempering_data': [(350, 61.5), (400, 59.5), (450, 57.5)],
+        'forging_range': (1650, 2150),
+        'movement_level': 2,
+        'scale_loss': (2.0, 5.0),
+        'decarb_depth': (0.020, 0.040),
+        'etch_color': 'dark',
+        'notes': 'Normalizing: 1600F, hold 10 mins, air cool before hardening.',
+        'is_custom': False
+    },
+    '15N20': {
+        'name': '15N20 High Nickel Alloy Steel',
+        'category': 'High Carbon / Nickel Alloy',
+        'density': 0.284,
+        'thermal_expansion': 7.1e-6,
+        'thermal_conductivity': 26.5,
+        'modulus_elasticity': 30,
+        'austenitizing_temp': (1475, 1525),
+        'quench_method': 'Oil',
+        'tempering_data': [(350, 60), (400, 58), (450, 56)],
+        'forging_range': (1650, 2100),
+        'movement_level': 3,
+        'scale_loss': (1.5, 3.0),
+        'decarb_depth': (0.015, 0.025),
+        'etch_color': 'bright',
+        'notes': 'Composition: 0.75% C, 2.0% Ni. Provides bright layers in Damascus due to nickel resisting etchant.',
+        'is_custom': False
+    },
+    'O1': {
+        'name': 'O1 Oil-Hardening Tool Steel',
+        'category': 'Low Alloy Tool Steel',
+        'density': 0.283,
+        'thermal_expansion': 7.7e-6,
+        'thermal_conductivity': 19.0,
+        'modulus_elasticity': 30,
+        'austenitizing_temp': (1450, 1500),
+        'quench_method': 'Warm oil (125-150°F)',
+        'tempering_data': [(300, 64), (400, 62), (500, 59)],
+        'forging_range': (1800, 2100),
+        'movement_level': 5,
+        'scale_loss': (1.5, 3.0),
+        'decarb_depth': (0.015, 0.025),
+        'etch_color': 'medium-dark',
+        'notes': 'Annealing: 1450F, cool 20F/hr to 900F. Stress relief: 1200-1250F, 1 hour.',
+        'is_custom': False
+    },
+    'A2': {
+        'name': 'A2 Air-Hardening Tool Steel',
+        'category': 'High Alloy Tool Steel',
+        'density': 0.284,
+        'thermal_expansion': 7.5e-6,
+        'thermal_conductivity': 15.1,
+        'modulus_elasticity': 29,
+        'austenitizing_temp': (1750, 1800),
+        'quench_method': 'Still air or positive pressure air to 150F',
+        'tempering_data': [(350, 61), (400, 59.5), (500, 57.5)],
+        'forging_range': (1850, 2150),
+        'movement_level': 8,
+        'scale_loss': (0.5, 2.0),
+        'decarb_depth': (0.010, 0.020),
+        'etch_color': 'medium',
+        'notes': 'Preheat to 1100-1200F. Impact toughness: 40 ft-lbs at 60 HRC. High chromium provides dimensional stability.',
+        'is_custom': False
+    },
+    'D2': {
+        'name': 'D2 High-Carbon High-Chromium Tool Steel',
+        'category': 'High Alloy Tool Steel',
+        'density': 0.284,
+        'thermal_expansion': 7.3e-6,
+        'thermal_conductivity': 14.0,
+        'modulus_elasticity': 29,
+        'austenitizing_temp': (1825, 1875),
+        'quench_method': 'Air or oil',
+        'tempering_data': [(400, 61), (500, 59), (600, 57)],
+        'forging_range': (1850, 2150),
+        'movement_level': 9,
+        'scale_loss': (0.5, 2.0),
+        'decarb_depth': (0.010, 0.020),
+        'etch_color': 'medium',
+        'notes': '12% Chromium. Very stiff during forging. Requires heavy equipment.',
+        'is_custom': False
+    },
+    'MagnaCut': {
+        'name': 'CPM MagnaCut',
+        'category': 'Powder Metallurgy',
+        'density': 0.280,
+        'thermal_expansion': 6.4e-6,
+        'thermal_conductivity': 11.2,
+        'modulus_elasticity': 31,
+        'austenitizing_temp': (2050, 2050),
+        'quench_method': 'Plate quench or fast air',
+        'tempering_data': [(300, 62), (350, 61)],
+        'forging_range': (1900, 2100),
+        'movement_level': 10,
+        'scale_loss': (0.5, 1.5),
+        'decarb_depth': (0.005, 0.015),
+        'etch_color': 'medium-bright',
+        'notes': 'Must use foil wrap or vacuum. Requires cryogenic treatment after quench. Impact toughness: 16 ft-lbs at 62 HRC.',
+        'is_custom': False
+    },
+    'CruWear': {
+        'name': 'CPM CruWear',
+        'category': 'Powder Metallurgy',
+        'density': 0.282,
+        'thermal_expansion': 7.0e-6,
+        'thermal_conductivity': 10.5,
+        'modulus_elasticity': 30,
+        'austenitizing_temp': (1950, 2050),
+        'quench_method': 'Air or plate quench',
+        'tempering_data': [(1000, 62)],  # Triple temper
+        'forging_range': (1900, 2100),
+        'movement_level': 10,
+        'scale_loss': (0.5, 1.5),
+        'decarb_depth': (0.005, 0.015),
+        'etch_color': 'medium',
+        'notes': 'Preheat to 1550F. Triple temper at 1000F for max stability. Impact: 25-30 ft-lbs at 62 HRC.',
+        'is_custom': False
+    },
+    '52100': {
+        'name': '52100 Bearing Steel',
+        'category': 'High Carbon / Low Chrome',
+        'density': 0.284,
+        'thermal_expansion': 7.0e-6,
+        'thermal_conductivity': 24.0,
+        'modulus_elasticity': 30,
+        'austenitizing_temp': (1475, 1550),
+        'quench_method': 'Oil',
+        'tempering_data': [(350, 61), (400, 59), (450, 57)],
+        'forging_range': (1700, 2100),
+        'movement_level': 4,
+        'scale_loss': (1.5, 3.5),
+        'decarb_depth': (0.015, 0.030),
+        'etch_color': 'dark',
+        'notes': '~1.5% Chromium. Sensitive to overheating above 2150F (red shortness).',
+        'is_custom': False
+    }
+}
+
+
 class Steel:
     """
     Represents a steel type with all its physical and forging properties.
     """
     
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        'name', 'category', 'is_custom',
+        'density', 'thermal_expansion', 'thermal_conductivity', 'modulus_elasticity',
+        'austenitizing_temp', 'quench_method', 'tempering_data',
+        'forging_range', 'movement_level',
+        'scale_loss', 'decarb_depth',
+        'etch_color', 'notes',
+        'created_date', 'created_by',
+        '_display_text',
+        '__weakref__',  # keys of _github_markdown_cache
+    )
+    
     def __init__(self, data: Dict[str, Any]):
         """
         Initialize steel from dictionary.
@@ -31,7 +244,8 @@ class Steel:
         """
         # Basic info
         self.name = data.get('name', 'Unknown Steel')
-        self.category = data.get('category', 'Custom')
+        # Low-cardinality labels are interned so steels share one copy
+        self.category = _intern(data.get('category', 'Custom'))
         self.is_custom = data.get('is_custom', False)
         
         # Physical properties
@@ -42,7 +256,7 @@ class Steel:
         
         # Heat treatment
         self.austenitizing_temp = data.get('austenitizing_temp', (1500, 1500))  # °F (min, max)
-        self.quench_method = data.get('quench_method', 'Oil')
+        self.quench_method = _intern(data.get('quench_method', 'Oil'))
         self.tempering_data = data.get('tempering_data', [])  # List of (temp, hardness) tuples
         
         # Forging properties
@@ -54,14 +268,18 @@ class Steel:
         self.decarb_depth = data.get('decarb_depth', (0.020, 0.040))  # inches (min, max)
         
         # Visual properties
-        self.etch_color = data.get('etch_color', 'medium')  # 'bright', 'medium', 'dark'
+        self.etch_color = _intern(data.get('etch_color', 'medium'))  # 'bright', 'medium', 'dark'
         
         # Optional notes
         self.notes = data.get('notes', '')
         
         # Metadata
-        self.created_date = data.get('created_date', datetime.now().isoformat())
-        self.created_by = data.get('created_by', 'Built-in')
+        # Only stamp steels that don't carry a date (e.g. reloaded from JSON)
+        self.created_date = data['created_date'] if 'created_date' in data else datetime.now().isoformat()
+        self.created_by = _intern(data.get('created_by', 'Built-in'))
+        
+        # Reference text, built on first get_display_text() call
+        self._display_text: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert steel to dictionary for JSON serialization."""
@@ -87,45 +305,60 @@ class Steel:
         }
     
     def get_display_text(self) -> str:
-        """Get formatted text for display in reference viewer."""
+        """
+        Get formatted text for display in reference viewer.
+        
+        The text is built once and reused; steels aren't modified after
+        construction.
+        """
+        if self._display_text is not None:
+            return self._display_text
+        
         # Note: We'll format bold in the GUI using tags, so we return tuples of (text, tag)
         # For now, return plain text with special markers that GUI will parse
-        text = f"━━━ {self.name} ━━━\n\n"
+        parts = [f"━━━ {self.name} ━━━\n\n"]
+        append = parts.append
         
-        text += f"Category: {self.category}\n"
+        append(f"Category: {self.category}\n")
         if self.is_custom:
-            text += f"[Custom Steel - Added by: {self.created_by}]\n"
-        text += "\n"
-        
-        text += "═══ PHYSICAL PROPERTIES ═══\n\n"
-        text += f"  Density:\n    {self.density:.3f} lb/in³\n\n"
-        text += f"  Thermal Expansion:\n    {self.thermal_expansion:.2e} in/in/°F\n\n"
-        text += f"  Thermal Conductivity:\n    {self.thermal_conductivity:.1f} BTU/hr/ft/F\n\n"
-        text += f"  Modulus of Elasticity:\n    {self.modulus_elasticity} psi x 10^6\n\n"
-        
-        text += "\n═══ HEAT TREATMENT ═══\n\n"
-        text += f"  Austenitizing Temperature:\n    {self.austenitizing_temp[0]}-{self.austenitizing_temp[1]}°F\n\n"
-        text += f"  Quench Method:\n    {self.quench_method}\n\n"
+            append(f"[Custom Steel - Added by: {self.created_by}]\n")
+        append("\n")
+        
+        append("═══ PHYSICAL PROPERTIES ═══\n\n")
+        append(f"  Density:\n    {self.density:.3f} lb/in³\n\n")
+        append(f"  Thermal Expansion:\n    {self.thermal_expansion:.2e} in/in/°F\n\n")
+        append(f"  Thermal Conductivity:\n    {self.thermal_conductivity:.1f} BTU/hr/ft/F\n\n")
+        append(f"  Modulus of Elasticity:\n    {self.modulus_elasticity} psi x 10^6\n\n")
+        
+        append("\n═══ HEAT TREATMENT ═══\n\n")
+        append(f"  Austenitizing Temperature:\n    {self.austenitizing_temp[0]}-{self.austenitizing_temp[1]}°F\n\n")
+        append(f"  Quench Method:\n    {self.quench_method}\n\n")
         if self.tempering_data:
-            text += "  Tempering (Double temper 2 hours each):\n"
-            for temp, hardness in self.tempering_data:
-                text += f"    {temp}°F → {hardness} HRC\n"
-            text += "\n"
-        
-        text += "\n═══ FORGING CHARACTERISTICS ═══\n\n"
-        text += f"  Forging Temperature Range:\n    {self.forging_range[0]}-{self.forging_range[1]}°F\n\n"
-        text += f"  Movement Level:\n    {self.movement_level}/10 (1=easy, 10=very stiff)\n\n"
-        text += f"  Scale Loss:\n    {self.scale_loss[0]:.1f}-{self.scale_loss[1]:.1f}% per hour of soak time\n\n"
-        text += f"  Decarburization Depth:\n    {self.decarb_depth[0]:.3f}\"-{self.decarb_depth[1]:.3f}\" per session\n\n"
-        text += f"  Etch Appearance:\n    {self.etch_color.capitalize()} (in Damascus patterns)\n\n"
+            append("  Tempering (Double temper 2 hours each):\n")
+            parts.extend(f"    {temp}°F → {hardness} HRC\n" for temp, hardness in self.tempering_data)
+            append("\n")
+        
+        append("\n═══ FORGING CHARACTERISTICS ═══\n\n")
+        append(f"  Forging Temperature Range:\n    {self.forging_range[0]}-{self.forging_range[1]}°F\n\n")
+        append(f"  Movement Level:\n    {self.movement_level}/10 (1=easy, 10=very stiff)\n\n")
+        append(f"  Scale Loss:\n    {self.scale_loss[0]:.1f}-{self.scale_loss[1]:.1f}% per hour of soak time\n\n")
+        append(f"  Decarburization Depth:\n    {self.decarb_depth[0]:.3f}\"-{self.decarb_depth[1]:.3f}\" per session\n\n")
+        append(f"  Etch Appearance:\n    {self.etch_color.capitalize()} (in Damascus patterns)\n\n")
         
         if self.notes:
-            text += "\n═══ ADDITIONAL NOTES ═══\n\n"
-            text += f"{self.notes}\n"
+            append("\n═══ ADDITIONAL NOTES ═══\n\n")
+            append(f"{self.notes}\n")
         
+        text = ''.join(parts)
+        self._display_text = text
         return text
 
 
+# Markdown built by export_steel_for_github(), per steel; entries go away
+# with their Steel
+_github_markdown_cache: "weakref.WeakKeyDictionary[Steel, str]" = weakref.WeakKeyDictionary()
+
+
 class SteelDatabase:
     """
     Manages built-in and custom steels.
@@ -147,200 +380,86 @@ class SteelDatabase:
             self.custom_steels_file = DEFAULT_CUSTOM_STEELS_PATH
         self.steels: Dict[str, Steel] = {}
         
-        # Load built-in steels
-        self._load_builtin_steels()
+        # Built-in steels are constructed on first use (see get_steel and
+        # _load_builtin_steels), so opening the database only reads the
+        # custom steels file
+        self._builtins_loaded = False
+        
+        # category -> {key: Steel}, built on first get_steels_by_category()
+        # and dropped whenever the set of steels changes
+        self._by_category: Optional[Dict[str, Dict[str, Steel]]] = None
+        
+        # Keys of custom steels in insertion order (a dict used as an
+        # ordered set), so saving doesn't have to scan the built-ins
+        self._custom_keys: Dict[str, None] = {}
         
         # Load custom steels
         self._load_custom_steels()
     
     def _load_builtin_steels(self):
-        """Load built-in steel definitions."""
-        builtin = {
-            '1084': {
-                'name': '1084 High Carbon Steel',
-                'category': 'High Carbon',
-                'density': 0.284,
-                'thermal_expansion': 7.2e-6,
-                'thermal_conductivity': 28.0,
-                'modulus_elasticity': 30,
-                'austenitizing_temp': (1500, 1500),
-                'quench_method': 'Oil (Parks 50 or preheated Canola)',
-                'tempering_data': [(350, 61.5), (400, 59.5), (450, 57.5)],
-                'forging_range': (1650, 2150),
-                'movement_level': 2,
-                'scale_loss': (2.0, 5.0),
-                'decarb_depth': (0.020, 0.040),
-                'etch_color': 'dark',
-                'notes': 'Normalizing: 1600F, hold 10 mins, air cool before hardening.',
-                'is_custom': False
-            },
-            '15N20': {
-                'name': '15N20 High Nickel Alloy Steel',
-                'category': 'High Carbon / Nickel Alloy',
-                'density': 0.284,
-                'thermal_expansion': 7.1e-6,
-                'thermal_conductivity': 26.5,
-                'modulus_elasticity': 30,
-                'austenitizing_temp': (1475, 1525),
-                'quench_method': 'Oil',
-                'tempering_data': [(350, 60), (400, 58), (450, 56)],
-                'forging_range': (1650, 2100),
-                'movement_level': 3,
-                'scale_loss': (1.5, 3.0),
-                'decarb_depth': (0.015, 0.025),
-                'etch_color': 'bright',
-                'notes': 'Composition: 0.75% C, 2.0% Ni. Provides bright layers in Damascus due to nickel resisting etchant.',
-                'is_custom': False
-            },
-            'O1': {
-                'name': 'O1 Oil-Hardening Tool Steel',
-                'category': 'Low Alloy Tool Steel',
-                'density': 0.283,
-                'thermal_expansion': 7.7e-6,
-                'thermal_conductivity': 19.0,
-                'modulus_elasticity': 30,
-                'austenitizing_temp': (1450, 1500),
-                'quench_method': 'Warm oil (125-150°F)',
-                'tempering_data': [(300, 64), (400, 62), (500, 59)],
-                'forging_range': (1800, 2100),
-                'movement_level': 5,
-                'scale_loss': (1.5, 3.0),
-                'decarb_depth': (0.015, 0.025),
-                'etch_color': 'medium-dark',
-                'notes': 'Annealing: 1450F, cool 20F/hr to 900F. Stress relief: 1200-1250F, 1 hour.',
-                'is_custom': False
-            },
-            'A2': {
-                'name': 'A2 Air-Hardening Tool Steel',
-                'category': 'High Alloy Tool Steel',
-                'density': 0.284,
-                'thermal_expansion': 7.5e-6,
-                'thermal_conductivity': 15.1,
-                'modulus_elasticity': 29,
-                'austenitizing_temp': (1750, 1800),
-                'quench_method': 'Still air or positive pressure air to 150F',
-                'tempering_data': [(350, 61), (400, 59.5), (500, 57.5)],
-                'forging_range': (1850, 2150),
-                'movement_level': 8,
-                'scale_loss': (0.5, 2.0),
-                'decarb_depth': (0.010, 0.020),
-                'etch_color': 'medium',
-                'notes': 'Preheat to 1100-1200F. Impact toughness: 40 ft-lbs at 60 HRC. High chromium provides dimensional stability.',
-                'is_custom': False
-            },
-            'D2': {
-                'name': 'D2 High-Carbon High-Chromium Tool Steel',
-                'category': 'High Alloy Tool Steel',
-                'density': 0.284,
-                'thermal_expansion': 7.3e-6,
-                'thermal_conductivity': 14.0,
-                'modulus_elasticity': 29,
-                'austenitizing_temp': (1825, 1875),
-                'quench_method': 'Air or oil',
-                'tempering_data': [(400, 61), (500, 59), (600, 57)],
-                'forging_range': (1850, 2150),
-                'movement_level': 9,
-                'scale_loss': (0.5, 2.0),
-                'decarb_depth': (0.010, 0.020),
-                'etch_color': 'medium',
-                'notes': '12% Chromium. Very stiff during forging. Requires heavy equipment.',
-                'is_custom': False
-            },
-            'MagnaCut': {
-                'name': 'CPM MagnaCut',
-                'category': 'Powder Metallurgy',
-                'density': 0.280,
-                'thermal_expansion': 6.4e-6,
-                'thermal_conductivity': 11.2,
-                'modulus_elasticity': 31,
-                'austenitizing_temp': (2050, 2050),
-                'quench_method': 'Plate quench or fast air',
-                'tempering_data': [(300, 62), (350, 61)],
-                'forging_range': (1900, 2100),
-                'movement_level': 10,
-                'scale_loss': (0.5, 1.5),
-                'decarb_depth': (0.005, 0.015),
-                'etch_color': 'medium-bright',
-                'notes': 'Must use foil wrap or vacuum. Requires cryogenic treatment after quench. Impact toughness: 16 ft-lbs at 62 HRC.',
-                'is_custom': False
-            },
-            'CruWear': {
-                'name': 'CPM CruWear',
-                'category': 'Powder Metallurgy',
-                'density': 0.282,
-                'thermal_expansion': 7.0e-6,
-                'thermal_conductivity': 10.5,
-                'modulus_elasticity': 30,
-                'austenitizing_temp': (1950, 2050),
-                'quench_method': 'Air or plate quench',
-                'tempering_data': [(1000, 62)],  # Triple temper
-                'forging_range': (1900, 2100),
-                'movement_level': 10,
-                'scale_loss': (0.5, 1.5),
-                'decarb_depth': (0.005, 0.015),
-                'etch_color': 'medium',
-                'notes': 'Preheat to 1550F. Triple temper at 1000F for max stability. Impact: 25-30 ft-lbs at 62 HRC.',
-                'is_custom': False
-            },
-            '52100': {
-                'name': '52100 Bearing Steel',
-                'category': 'High Carbon / Low Chrome',
-                'density': 0.284,
-                'thermal_expansion': 7.0e-6,
-                'thermal_conductivity': 24.0,
-                'modulus_elasticity': 30,
-                'austenitizing_temp': (1475, 1550),
-                'quench_method': 'Oil',
-                'tempering_data': [(350, 61), (400, 59), (450, 57)],
-                'forging_range': (1700, 2100),
-                'movement_level': 4,
-                'scale_loss': (1.5, 3.5),
-                'decarb_depth': (0.015, 0.030),
-                'etch_color': 'dark',
-                'notes': '~1.5% Chromium. Sensitive to overheating above 2150F (red shortness).',
-                'is_custom': False
-            }
-        }
+        """
+        Construct any built-in steels not built yet.
         
-        for key, data in builtin.items():
-            self.steels[key] = Steel(data)
+        Built-ins are otherwise only built on demand by get_steel(); this
+        runs before anything that walks the whole database. Built-ins keep
+        their place ahead of custom steels, and a custom steel saved under
+        a built-in key still takes its place.
+        """
+        if self._builtins_loaded:
+            return
+        steels = {key: self.steels.get(key) or Steel(data)
+                  for key, data in _BUILTIN_STEEL_DATA.items()}
+        steels.update(self.steels)
+        self.steels = steels
+        self._builtins_loaded = True
+        self._by_category = None
     
     def _load_custom_steels(self):
         """Load custom steels from JSON file."""
         if self.custom_steels_file.exists():
             try:
-                with self.custom_steels_file.open('r', encoding='utf-8') as f:
-                    custom_data = json.load(f)
+                custom_data = _loads(self.custom_steels_file.read_bytes())
+                if not isinstance(custom_data, dict):
+                    raise ValueError("expected a JSON object of steels")
                 
+                # Reject malformed entries here rather than when the UI
+                # formats them; the rest of the file still loads
+                loaded = 0
                 for key, data in custom_data.items():
+                    problem = _steel_data_problem(data)
+                    if problem is not None:
+                        print(f"Skipping custom steel '{key}': {problem}")
+                        continue
                     data['is_custom'] = True
                     self.steels[key] = Steel(data)
+                    self._custom_keys[key] = None
+                    loaded += 1
                 
-                print(f"Loaded {len(custom_data)} custom steels from {self.custom_steels_file}")
+                print(f"Loaded {loaded} custom steels from {self.custom_steels_file}")
             except Exception as e:
                 print(f"Error loading custom steels: {e}")
     
     def save_custom_steels(self):
         """Save all custom steels to JSON file."""
-        custom_data = {}
-        
-        for key, steel in self.steels.items():
-            if steel.is_custom:
-                custom_data[key] = steel.to_dict()
+        custom_data = {key: self.steels[key].to_dict() for key in self._custom_keys}
         
         self.custom_steels_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.custom_steels_file.open('w', encoding='utf-8') as f:
-            json.dump(custom_data, f, indent=2)
+        # Write a complete file alongside the old one and swap it in, so an
+        # interrupted save can't leave a truncated custom_steels.json
+        tmp_path = self.custom_steels_file.with_name(self.custom_steels_file.name + '.tmp')
+        tmp_path.write_bytes(_dumps_indented(custom_data))
+        os.replace(tmp_path, self.custom_steels_file)
         
         print(f"Saved {len(custom_data)} custom steels to {self.custom_steels_file}")
     
-    def add_custom_steel(self, key: str, data: Dict[str, Any]) -> Steel:
+    def add_custom_steel(self, key: str, data: Dict[str, Any], autosave: bool = True) -> Steel:
         """
         Add a new custom steel.
         
         Args:
             key: Unique identifier for the steel
             data: Dictionary with steel properties
+            autosave: Rewrite the custom steels file straight away
             
         Returns:
             The created Steel object
@@ -348,78 +467,129 @@ class SteelDatabase:
         data['is_custom'] = True
         steel = Steel(data)
         self.steels[key] = steel
-        self.save_custom_steels()
+        self._custom_keys[key] = None
+        self._by_category = None
+        if autosave:
+            self.save_custom_steels()
         return steel
     
+    def add_custom_steels(self, items: Dict[str, Dict[str, Any]]) -> List[Steel]:
+        """
+        Add several custom steels, saving the file once at the end.
+        
+        Use this for imports: add_custom_steel() rewrites every custom
+        steel on each call.
+        
+        Args:
+            items: Mapping of unique identifier -> dictionary with steel properties
+            
+        Returns:
+            The created Steel objects, in the order given
+        """
+        steels = [self.add_custom_steel(key, data, autosave=False) for key, data in items.items()]
+        self.save_custom_steels()
+        return steels
+    
     def get_steel(self, key: str) -> Optional[Steel]:
         """Get steel by key."""
-        return self.steels.get(key)
+        steel = self.steels.get(key)
+        if steel is None and key in _BUILTIN_STEEL_DATA:
+            steel = self.steels[key] = Steel(_BUILTIN_STEEL_DATA[key])
+        return steel
     
     def get_all_steels(self) -> Dict[str, Steel]:
         """Get all steels (built-in and custom)."""
+        self._load_builtin_steels()
         return self.steels
     
     def get_steel_names(self) -> list:
         """Get list of all steel names."""
+        self._load_builtin_steels()
         return [steel.name for steel in self.steels.values()]
     
     def get_steels_by_category(self, category: str) -> Dict[str, Steel]:
         """Get all steels in a category."""
-        return {k: v for k, v in self.steels.items() if v.category == category}
+        self._load_builtin_steels()
+        if self._by_category is None:
+            by_category: Dict[str, Dict[str, Steel]] = {}
+            for k, v in self.steels.items():
+                by_category.setdefault(v.category, {})[k] = v
+            self._by_category = by_category
+        return dict(self._by_category.get(category, {}))
     
     def export_steel_for_github(self, steel: Steel) -> str:
         """
         Export steel data formatted for GitHub issue.
         
+        Like get_display_text(), the markdown is built once per steel and
+        reused.
+        
         Args:
             steel: Steel object to export
             
         Returns:
             Markdown-formatted text for GitHub issue
         """
-        md = f"### New Steel Submission: {steel.name}\n\n"
-        md += f"**Category:** {steel.category}\n"
-        md += f"**Submitted by:** {steel.created_by}\n"
-        md += f"**Date:** {steel.created_date}\n\n"
-        
-        md += "#### Physical Properties\n"
-        md += f"- Density: {steel.density:.3f} lb/in³\n"
-        md += f"- Thermal Expansion: {steel.thermal_expansion:.2e} in/in/°F\n"
-        md += f"- Thermal Conductivity: {steel.thermal_conductivity:.1f} BTU/hr/ft/F\n"
-        md += f"- Modulus of Elasticity: {steel.modulus_elasticity} psi x 10^6\n\n"
-        
-        md += "#### Heat Treatment\n"
-        md += f"- Austenitizing: {steel.austenitizing_temp[0]}-{steel.austenitizing_temp[1]}°F\n"
-        md += f"- Quench: {steel.quench_method}\n"
+        markdown = _github_markdown_cache.get(steel)
+        if markdown is not None:
+            return markdown
+        
+        parts = [f"### New Steel Submission: {steel.name}\n\n"]
+        append = parts.append
+        append(f"**Category:** {steel.category}\n")
+        append(f"**Submitted by:** {steel.created_by}\n")
+        append(f"**Date:** {steel.created_date}\n\n")
+        
+        append("#### Physical Properties\n")
+        append(f"- Density: {steel.density:.3f} lb/in³\n")
+        append(f"- Thermal Expansion: {steel.thermal_expansion:.2e} in/in/°F\n")
+        append(f"- Thermal Conductivity: {steel.thermal_conductivity:.1f} BTU/hr/ft/F\n")
+        append(f"- Modulus of Elasticity: {steel.modulus_elasticity} psi x 10^6\n\n")
+        
+        append("#### Heat Treatment\n")
+        append(f"- Austenitizing: {steel.austenitizing_temp[0]}-{steel.austenitizing_temp[1]}°F\n")
+        append(f"- Quench: {steel.quench_method}\n")
         if steel.tempering_data:
-            md += "- Tempering:\n"
-            for temp, hardness in steel.tempering_data:
-                md += f"  - {temp}°F: {hardness} HRC\n"
-        md += "\n"
-        
-        md += "#### Forging Characteristics\n"
-        md += f"- Forging Range: {steel.forging_range[0]}-{steel.forging_range[1]}°F\n"
-        md += f"- Movement Level: {steel.movement_level}/10\n"
-        md += f"- Scale Loss: {steel.scale_loss[0]:.1f}-{steel.scale_loss[1]:.1f}% per hour\n"
-        md += f"- Decarburization: {steel.decarb_depth[0]:.3f}\"-{steel.decarb_depth[1]:.3f}\"\n"
-        md += f"- Etch Color: {steel.etch_color}\n\n"
+            append("- Tempering:\n")
+            parts.extend(f"  - {temp}°F: {hardness} HRC\n" for temp, hardness in steel.tempering_data)
+        append("\n")
+        
+        append("#### Forging Characteristics\n")
+        append(f"- Forging Range: {steel.forging_range[0]}-{steel.forging_range[1]}°F\n")
+        append(f"- Movement Level: {steel.movement_level}/10\n")
+        append(f"- Scale Loss: {steel.scale_loss[0]:.1f}-{steel.scale_loss[1]:.1f}% per hour\n")
+        append(f"- Decarburization: {steel.decarb_depth[0]:.3f}\"-{steel.decarb_depth[1]:.3f}\"\n")
+        append(f"- Etch Color: {steel.etch_color}\n\n")
         
         if steel.notes:
-            md += "#### Notes\n"
-            md += f"{steel.notes}\n\n"
+            append("#### Notes\n")
+            append(f"{steel.notes}\n\n")
         
-        md += "---\n"
-        md += "Please review this submission and consider adding it to the built-in steel database.\n"
+        append("---\n")
+        append("Please review this submission and consider adding it to the built-in steel database.\n")
         
-        return md
+        markdown = ''.join(parts)
+        _github_markdown_cache[steel] = markdown
+        return markdown
 
 
-# Global database instance
+# Global database instance; the lock makes sure concurrent first calls
+# (e.g. the GUI thread and a worker) load the custom steels file only once
 _database = None
+_database_lock = threading.Lock()
 
 def get_database() -> SteelDatabase:
     """Get or create the global steel database instance."""
     global _database
     if _database is None:
-        _database = SteelDatabase()
+        with _database_lock:
+            if _database is None:
+                _database = SteelDatabase()
     return _database
+
+
+def reset_database():
+    """Drop the global instance so the next get_database() reloads from disk."""
+    global _database
+    with _database_lock:
+        _database = None
@@ -5,7 +5,9 @@ Tests adding, loading, and exporting custom steels.
 """
 
 import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -13,11 +15,9 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from data.steel_database import Steel, get_database
+from data.steel_database import Steel, SteelDatabase, get_database, reset_database
 
 
-CUSTOM_STEELS_PATH = PROJECT_ROOT / "data" / "custom_steels.json"
-
 def test_custom_steel_creation():
     """Test creating a custom steel."""
     print("=" * 60)
@@ -52,14 +52,15 @@ def test_custom_steel_creation():
     
     return custom_steel
 
-def test_database_operations():
+def test_database_operations(tmp_path):
     """Test database add/save/load operations."""
     print("=" * 60)
     print("TEST 2: Database Operations")
     print("=" * 60)
     
-    # Get database instance
-    db = get_database()
+    # A database of our own, so the user's data/custom_steels.json is never touched
+    custom_steels_path = tmp_path / "custom_steels.json"
+    db = SteelDatabase(custom_steels_file=custom_steels_path)
     
     # Check built-in steels
     all_steels = db.get_all_steels()
@@ -83,11 +84,11 @@ def test_database_operations():
     custom_count = len([s for s in all_steels.values() if s.is_custom])
     print(f"✓ Database now has {custom_count} custom steel(s)")
     
-    # Check if data/custom_steels.json was created
-    if CUSTOM_STEELS_PATH.exists():
-        with CUSTOM_STEELS_PATH.open('r', encoding='utf-8') as f:
-            data = json.load(f)
-            print(f"✓ {CUSTOM_STEELS_PATH} created with {len(data)} steel(s)")
+    # Check the custom steels file was created
+    assert custom_steels_path.exists()
+    with custom_steels_path.open('r', encoding='utf-8') as f:
+        data = json.load(f)
+        print(f"✓ {custom_steels_path} created with {len(data)} steel(s)")
     
     print()
     return db
@@ -98,6 +99,8 @@ def test_steel_display():
     print("TEST 3: Steel Display Text")
     print("=" * 60)
     
+    # Fresh shared instance, so nothing cached by earlier users leaks in
+    reset_database()
     db = get_database()
     
     # Get a built-in steel
@@ -141,17 +144,143 @@ def test_github_export():
     
     return True
 
+def test_custom_steel_validation(tmp_path):
+    """Test that malformed custom steel entries are skipped on load."""
+    print("=" * 60)
+    print("TEST 5: Custom Steel Validation")
+    print("=" * 60)
+    
+    custom_steels_path = tmp_path / "custom_steels.json"
+    custom_steels_path.write_text(json.dumps({
+        'good': {'name': "Good Steel", 'density': 0.284, 'forging_range': [1600, 2100],
+                 'tempering_data': [[400, 60.0]]},
+        'bad_density': {'name': "Bad Density", 'density': "heavy"},
+        'bad_range': {'name': "Bad Range", 'forging_range': [1600]},
+        'bad_tempering': {'name': "Bad Tempering", 'tempering_data': [400, 60.0]},
+        'not_an_object': "1084",
+    }), encoding='utf-8')
+    
+    db = SteelDatabase(custom_steels_file=custom_steels_path)
+    
+    good = db.get_steel('good')
+    assert good is not None and good.is_custom
+    assert tuple(good.forging_range) == (1600, 2100)
+    print(f"✓ Accepted well-formed entry: {good.name}")
+    
+    for key in ('bad_density', 'bad_range', 'bad_tempering', 'not_an_object'):
+        assert db.get_steel(key) is None, key
+    print("✓ Skipped 4 malformed entries")
+    
+    print()
+    return True
+
+def test_custom_overrides_builtin(tmp_path):
+    """Test that a custom steel saved under a built-in key replaces it."""
+    print("=" * 60)
+    print("TEST 6: Custom Steel Overriding a Built-in")
+    print("=" * 60)
+    
+    custom_steels_path = tmp_path / "custom_steels.json"
+    custom_steels_path.write_text(json.dumps({
+        '1084': {'name': "My 1084", 'category': "High Carbon", 'movement_level': 4},
+    }), encoding='utf-8')
+    
+    db = SteelDatabase(custom_steels_file=custom_steels_path)
+    
+    # Looked up before the other built-ins are built
+    steel_1084 = db.get_steel('1084')
+    assert steel_1084.name == "My 1084" and steel_1084.is_custom
+    print(f"✓ get_steel('1084') returns the custom steel: {steel_1084.name}")
+    
+    # Building the rest of the built-ins must not bring the original back
+    all_steels = db.get_all_steels()
+    assert all_steels['1084'] is steel_1084
+    assert '15N20' in all_steels and not all_steels['15N20'].is_custom
+    assert db.get_steels_by_category("High Carbon")['1084'] is steel_1084
+    print(f"✓ Override kept after loading all {len(all_steels)} steels")
+    
+    print()
+    return True
+
+def test_batch_add_custom_steels(tmp_path):
+    """Test adding several custom steels with a single save."""
+    print("=" * 60)
+    print("TEST 7: Batch Custom Steel Import")
+    print("=" * 60)
+    
+    custom_steels_path = tmp_path / "custom_steels.json"
+    db = SteelDatabase(custom_steels_file=custom_steels_path)
+    
+    # Count the file writes the batch makes
+    saves = []
+    save_custom_steels = db.save_custom_steels
+    def counting_save():
+        saves.append(1)
+        save_custom_steels()
+    db.save_custom_steels = counting_save
+    
+    steels = db.add_custom_steels({
+        'batch_a': {'name': "Batch A", 'movement_level': 2},
+        'batch_b': {'name': "Batch B", 'movement_level': 6},
+        'batch_c': {'name': "Batch C", 'movement_level': 9},
+    })
+    assert [steel.name for steel in steels] == ["Batch A", "Batch B", "Batch C"]
+    assert len(saves) == 1
+    print(f"✓ Added {len(steels)} steels with {len(saves)} save")
+    
+    # Everything reaches the file, in order
+    reloaded = SteelDatabase(custom_steels_file=custom_steels_path)
+    assert [key for key, steel in reloaded.get_all_steels().items() if steel.is_custom] == \
+        ['batch_a', 'batch_b', 'batch_c']
+    print("✓ Reloaded all batch steels from disk")
+    
+    print()
+    return True
+
+def test_atomic_save(tmp_path):
+    """Test that saving swaps in a complete file and leaves no temp file."""
+    print("=" * 60)
+    print("TEST 8: Atomic Custom Steel Save")
+    print("=" * 60)
+    
+    custom_steels_path = tmp_path / "custom_steels.json"
+    tmp_file = tmp_path / "custom_steels.json.tmp"
+    db = SteelDatabase(custom_steels_file=custom_steels_path)
+    db.add_custom_steel('first', {'name': "First Steel"})
+    assert custom_steels_path.exists() and not tmp_file.exists()
+    saved = custom_steels_path.read_bytes()
+    print("✓ Save replaced the file and left no temp file behind")
+    
+    # A save interrupted before the swap must leave the old file untouched
+    replace = os.replace
+    def failing_replace(src, dst):
+        raise OSError("simulated crash before rename")
+    os.replace = failing_replace
+    try:
+        db.add_custom_steel('second', {'name': "Second Steel"})
+    except OSError:
+        pass
+    else:
+        raise AssertionError("save should have failed")
+    finally:
+        os.replace = replace
+    
+    assert custom_steels_path.read_bytes() == saved
+    reloaded = SteelDatabase(custom_steels_file=custom_steels_path)
+    assert reloaded.get_steel('first') is not None and reloaded.get_steel('second') is None
+    print("✓ Interrupted save kept the previous custom_steels.json intact")
+    
+    print()
+    return True
+
 def cleanup():
-    """Clean up test files."""
+    """Drop the shared database instance the tests opened."""
     print("=" * 60)
     print("CLEANUP")
     print("=" * 60)
     
-    if CUSTOM_STEELS_PATH.exists():
-        CUSTOM_STEELS_PATH.unlink()
-        print(f"✓ Removed {CUSTOM_STEELS_PATH}")
-    else:
-        print("✓ No cleanup needed")
+    reset_database()
+    print("✓ Reset shared steel database")
     print()
 
 def main():
@@ -165,9 +294,18 @@ def main():
     try:
         # Run tests
         test_custom_steel_creation()
-        test_database_operations()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_database_operations(Path(tmp_dir))
         test_steel_display()
         test_github_export()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_custom_steel_validation(Path(tmp_dir))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_custom_overrides_builtin(Path(tmp_dir))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_batch_add_custom_steels(Path(tmp_dir))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_atomic_save(Path(tmp_dir))
         
         # Cleanup
         cleanup()